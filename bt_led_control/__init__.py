@@ -9,12 +9,37 @@ __version__ = "1.0.0"
 __author__ = "Malek Bsaissa"
 __description__ = "Control Magic Lantern LED lights via Bluetooth Low Energy"
 
+import asyncio
+import sys
+
+# Use uvloop's faster event loop for the BLE write path where available
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        # uvloop not installed - keep the default asyncio loop
+        pass
+
 # Import main classes for easy access (only import what doesn't require extra dependencies)
-from .commands import rgb_command, red, green, blue, white, off
-from .monitor import get_available_monitors, get_monitor_with_scaling_info
-from .color_utils import enhance_color_saturation, smooth_color_transition
+from .commands import rgb_command, rgb_bytes, red, green, blue, white, off
+from .monitor import (
+    get_all_monitors_with_scaling_info,
+    get_available_monitors,
+    get_monitor_at,
+    get_monitor_bboxes,
+    get_monitor_with_scaling_info,
+    invalidate_monitor_cache,
+)
+from .color_utils import (
+    average_region_colors,
+    enhance_color_saturation,
+    enhance_color_saturation_array,
+    smooth_color_transition,
+)
 from .ui_utils import display_available_monitors, choose_monitor_interactive
-from .utils import check_for_exit_key
+from .utils import check_for_exit_key, ExitKeyWatcher
 
 # Import screen capture (might need PIL)
 try:
@@ -41,6 +66,7 @@ __all__ = [
     "LT22Lamp",
     "BLEManager",
     "rgb_command",
+    "rgb_bytes",
     "red",
     "green",
     "blue",
@@ -49,11 +75,18 @@ __all__ = [
     "ScreenColorCapture",
     "get_screen_average_color",
     "get_screen_edge_color",
+    "get_all_monitors_with_scaling_info",
     "get_available_monitors",
+    "get_monitor_at",
+    "get_monitor_bboxes",
     "get_monitor_with_scaling_info",
+    "invalidate_monitor_cache",
+    "average_region_colors",
     "enhance_color_saturation",
+    "enhance_color_saturation_array",
     "smooth_color_transition",
     "display_available_monitors",
     "choose_monitor_interactive",
     "check_for_exit_key",
+    "ExitKeyWatcher",
 ]
@@ -1,6 +1,8 @@
 import asyncio
-from typing import Optional, List
+import sys
+from typing import Optional, List, Union
 from bleak import BleakClient, BleakScanner, BLEDevice
+from bleak.backends.characteristic import BleakGATTCharacteristic
 
 
 class BLEManager:
@@ -9,9 +11,24 @@ class BLEManager:
     # Magic Lantern command characteristic UUID
     COMMAND_CHAR_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
 
-    def __init__(self, device_address: str = "BE:28:72:00:39:FD"):
-        self.device_address = device_address
+    def __init__(
+        self,
+        device_address: str = "BE:28:72:00:39:FD",
+        device: Optional[BLEDevice] = None,
+    ):
+        # An already-discovered BLEDevice lets connect() skip scanning entirely
+        self.device = device
+        self.device_address = device.address if device else device_address
         self.client: Optional[BleakClient] = None
+        self.command_char: Optional[BleakGATTCharacteristic] = None
+        self.write_with_response = True
+        # The first write after connecting is acknowledged even in
+        # Write-Without-Response mode, as a sync point with the device
+        self._confirm_next_write = True
+        self.mtu = 23  # BLE default ATT MTU until negotiated
+        # Whether the device parses several 0x7E...0xEF frames from one write;
+        # off by default since not every clone accepts it
+        self.batch_frames = False
 
     async def scan_for_devices(
         self, timeout: float = 1.0, display: bool = False
@@ -26,31 +43,113 @@ class BLEManager:
         return devices
 
     async def find_device(self, timeout: float = 5.0) -> Optional[BLEDevice]:
-        """Find the target device by address."""
-        devices = await self.scan_for_devices(timeout=timeout)
+        """Find the target device by address, returning on its first advertisement."""
+        return await BleakScanner.find_device_by_address(
+            self.device_address, timeout=timeout
+        )
 
-        for device in devices:
-            if device.address == self.device_address:
-                return device
-        return None
-
-    async def connect(self) -> bool:
+    async def connect(self, timeout: float = 3.0) -> bool:
         """Connect to the target device."""
         if self.is_connected():
             return True
 
+        # Connect straight to the known target first; the OS stack usually still
+        # has it cached, which saves a full scan on reconnects
+        if await self._connect_client(self.device or self.device_address, timeout):
+            return True
+
+        # Only scan if the direct attempt failed
         device = await self.find_device()
         if not device:
             return False
+        self.device = device
+
+        # Passing the BLEDevice (not the address) avoids a second scan in bleak
+        return await self._connect_client(device, timeout)
 
+    async def _connect_client(
+        self, target: Union[BLEDevice, str], timeout: float
+    ) -> bool:
+        """Open a client to a BLEDevice or address and prepare it for writes."""
         try:
-            self.client = BleakClient(device.address)
-            await self.client.connect()
+            self.client = BleakClient(target)
+            await self.client.connect(timeout=timeout)
+            self._resolve_command_char()
+            self._request_fast_connection()
+            await self._negotiate_mtu()
             return self.client.is_connected
+        except asyncio.CancelledError:
+            # Timed out by the caller; don't keep the half-open client around
+            self.client = None
+            raise
         except Exception:
             self.client = None
             return False
 
+    def _resolve_command_char(self):
+        """Look up the command characteristic once and pick the write mode."""
+        self.command_char = self.client.services.get_characteristic(
+            self.COMMAND_CHAR_UUID
+        )
+        # Write-Without-Response lets color updates pipeline instead of waiting
+        # for an ACK per write; fall back if the device doesn't support it
+        self.write_with_response = not (
+            self.command_char is not None
+            and "write-without-response" in self.command_char.properties
+        )
+        self._confirm_next_write = True
+
+    def _request_fast_connection(self):
+        """
+        Ask the OS for a short connection interval so ambient updates aren't capped
+        by the peer's default (often 50-250 ms).
+
+        Best effort only: Windows exposes this through WinRT, BlueZ reads it from
+        the [LE] MinConnectionInterval/MaxConnectionInterval settings in
+        /etc/bluetooth/main.conf, and macOS has no API for it.
+        """
+        if sys.platform != "win32":
+            return
+
+        try:
+            try:
+                from winrt.windows.devices.bluetooth import (
+                    BluetoothLEPreferredConnectionParameters,
+                )
+            except ImportError:
+                from bleak_winrt.windows.devices.bluetooth import (
+                    BluetoothLEPreferredConnectionParameters,
+                )
+
+            backend = self.client._backend
+            session = getattr(backend, "_session", None)
+            if session is not None:
+                session.maintain_connection = True
+
+            requester = getattr(backend, "_requester", None)
+            if requester is not None:
+                requester.request_preferred_connection_parameters(
+                    BluetoothLEPreferredConnectionParameters.throughput_optimized
+                )
+        except Exception:
+            # Older Windows builds or bleak versions without this API
+            pass
+
+    async def _negotiate_mtu(self):
+        """Exchange a larger ATT MTU once at connect and remember it in self.mtu."""
+        try:
+            if sys.platform.startswith("linux"):
+                # BlueZ only learns the MTU when a notify/write socket is acquired;
+                # do it now so later writes take the same path every time
+                acquire_mtu = getattr(self.client._backend, "_acquire_mtu", None)
+                if acquire_mtu is not None:
+                    await acquire_mtu()
+            # WinRT and CoreBluetooth negotiate the MTU automatically on connect
+            self.mtu = self.client.mtu_size
+        except Exception:
+            # Keep the default MTU if the backend can't report one
+            self.mtu = 23
+
     async def disconnect(self) -> bool:
         """Disconnect from device."""
         if not self.is_connected():
@@ -59,6 +158,8 @@ class BLEManager:
         try:
             await self.client.disconnect()
             self.client = None
+            self.command_char = None
+            self.mtu = 23
             return True
         except Exception:
             return False
@@ -67,13 +168,52 @@ class BLEManager:
         """Check if connected to device."""
         return self.client is not None and self.client.is_connected
 
-    async def send_command(self, command: List[int]) -> bool:
+    async def send_command(self, command: Union[bytes, List[int]]) -> bool:
         """Send command to LED device."""
         if not self.is_connected():
             return False
 
         try:
-            await self.client.write_gatt_char(self.COMMAND_CHAR_UUID, bytes(command))
+            await self.client.write_gatt_char(
+                self.command_char or self.COMMAND_CHAR_UUID,
+                command if isinstance(command, bytes) else bytes(command),
+                response=self.write_with_response or self._confirm_next_write,
+            )
+            # Unacknowledged writes from here on, once one got through
+            self._confirm_next_write = False
             return True
         except Exception:
             return False
+
+    async def send_commands(self, commands: List[bytes]) -> bool:
+        """
+        Send several command frames, packing as many as fit into each write.
+
+        Frames are only concatenated when batch_frames is enabled; otherwise
+        they are sent one by one.
+
+        Args:
+            commands: Complete command frames (e.g. from rgb_bytes)
+
+        Returns:
+            True if every write succeeded
+        """
+        if not self.batch_frames:
+            for command in commands:
+                if not await self.send_command(command):
+                    return False
+            return True
+
+        # ATT write payload is the MTU minus the 3-byte opcode/handle header
+        max_payload = max(20, self.mtu - 3)
+        batch = b""
+        for command in commands:
+            if batch and len(batch) + len(command) > max_payload:
+                if not await self.send_command(batch):
+                    return False
+                batch = b""
+            batch += bytes(command)
+
+        if batch:
+            return await self.send_command(batch)
+        return True
@@ -2,7 +2,21 @@
 
 import numpy as np
 from PIL import Image
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba not available - the helpers below run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 
 class ColorTransitioner:
@@ -15,49 +29,48 @@ class ColorTransitioner:
         Args:
             transition_speed: How fast to transition (0.1 = slow, 0.3 = medium, 0.5+ = fast)
         """
-        self.current_left = (0, 0, 0)
-        self.current_right = (0, 0, 0)
-        self.target_left = (0, 0, 0)
-        self.target_right = (0, 0, 0)
+        # Row 0 is the left lamp, row 1 the right lamp
+        self._current = np.zeros((2, 3), dtype=np.int32)
+        self._target = np.zeros((2, 3), dtype=np.int32)
         self.transition_speed = transition_speed
 
+    @property
+    def current_left(self) -> Tuple[int, int, int]:
+        return tuple(self._current[0].tolist())
+
+    @property
+    def current_right(self) -> Tuple[int, int, int]:
+        return tuple(self._current[1].tolist())
+
+    @property
+    def target_left(self) -> Tuple[int, int, int]:
+        return tuple(self._target[0].tolist())
+
+    @property
+    def target_right(self) -> Tuple[int, int, int]:
+        return tuple(self._target[1].tolist())
+
     def set_targets(
         self, left_color: Tuple[int, int, int], right_color: Tuple[int, int, int]
     ):
         """Set the target colors for smooth transition."""
-        self.target_left = left_color
-        self.target_right = right_color
+        self._target[0] = left_color
+        self._target[1] = right_color
 
     def update_smooth_colors(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
         """Update current colors towards targets with smooth interpolation."""
-        # Smooth interpolation using exponential decay for natural motion
-        self.current_left = self._interpolate_color(self.current_left, self.target_left)
-        self.current_right = self._interpolate_color(
-            self.current_right, self.target_right
-        )
-
-        return self.current_left, self.current_right
-
-    def _interpolate_color(
-        self, current: Tuple[int, int, int], target: Tuple[int, int, int]
-    ) -> Tuple[int, int, int]:
-        """Smoothly interpolate between current and target color using exponential decay."""
-        factor = self.transition_speed
+        # Exponential decay for both lamps at once, in 16.16 fixed point so the
+        # whole step stays in integer arithmetic
+        factor = int(self.transition_speed * 65536)
+        self._current += ((self._target - self._current) * factor) >> 16
 
-        r = int(current[0] + (target[0] - current[0]) * factor)
-        g = int(current[1] + (target[1] - current[1]) * factor)
-        b = int(current[2] + (target[2] - current[2]) * factor)
-
-        return (r, g, b)
+        left, right = self._current.tolist()
+        return tuple(left), tuple(right)
 
     def is_close_to_target(self, threshold: int = 5) -> bool:
         """Check if current colors are close enough to targets."""
-        left_diff = sum(abs(c - t) for c, t in zip(self.current_left, self.target_left))
-        right_diff = sum(
-            abs(c - t) for c, t in zip(self.current_right, self.target_right)
-        )
-
-        return left_diff < threshold and right_diff < threshold
+        diffs = np.abs(self._current - self._target).sum(axis=1)
+        return bool((diffs < threshold).all())
 
     def reset(
         self,
@@ -65,19 +78,27 @@ class ColorTransitioner:
         right_color: Tuple[int, int, int] = (0, 0, 0),
     ):
         """Reset the transitioner to specific colors."""
-        self.current_left = left_color
-        self.current_right = right_color
-        self.target_left = left_color
-        self.target_right = right_color
+        self._current[0] = left_color
+        self._current[1] = right_color
+        self._target[:] = self._current
 
 
+@njit(cache=True, fastmath=True)
 def enhance_color_saturation(
     r: int, g: int, b: int, saturation_factor: float = 1.5
 ) -> Tuple[int, int, int]:
-    """Enhance color saturation by making dominant colors more pure, with enhanced red bias."""
-    # Find the dominant color and color differences
-    max_val = max(r, g, b)
-    min_val = min(r, g, b)
+    """Enhance color saturation by scaling HSV saturation while keeping hue and brightness."""
+    # Explicit comparisons instead of max()/min() so Numba infers plain ints
+    max_val = r
+    if g > max_val:
+        max_val = g
+    if b > max_val:
+        max_val = b
+    min_val = r
+    if g < min_val:
+        min_val = g
+    if b < min_val:
+        min_val = b
 
     # If the color is too dark overall, don't process it
     if max_val < 40:
@@ -86,75 +107,341 @@ def enhance_color_saturation(
     # Calculate how "gray" or washed out the color is
     color_range = max_val - min_val
 
-    # RED BIAS: Make red detection more sensitive - treat red as dominant even when slightly lower
-    red_bias = 1.15  # 15% bias towards red
-    effective_red = r * red_bias
+    # Grays and near-white carry no reliable hue - boosting would only tint them
+    if color_range <= 20 or (min_val > 220 and color_range < 35):
+        return (r, g, b)
 
-    # Detect special color combinations that should be preserved
-    # Cyan: high blue + high green, low red
-    if b > 200 and g > 200 and r < 100:
-        return (r, g, b)  # Keep cyan as-is
+    # If the color is already quite saturated, don't over-enhance
+    if color_range > 150 and saturation_factor > 1.2:
+        saturation_factor = 1.2
 
-    # Yellow: high red + high green, low blue (but reduce threshold for red)
-    if r > 180 and g > 200 and b < 100:  # Lower red threshold for yellow
-        return (r, g, b)  # Keep yellow as-is
+    # Scaling S at constant V moves every channel away from the maximum by the
+    # same ratio, which is the closed form of an HSV round-trip; hue is kept,
+    # so mixes like cyan, yellow and pink need no special-casing
+    new_range = color_range * saturation_factor
+    if new_range > max_val:
+        new_range = max_val
+    scale = new_range / color_range
 
-    # Pink/Magenta: high red + high blue, low green (enhanced red detection)
-    if r > 180 and b > 200 and g < 120:  # More lenient for red-dominant colors
-        return (r, g, b)  # Keep pink as-is
+    r = int(round(max_val - (max_val - r) * scale))
+    g = int(round(max_val - (max_val - g) * scale))
+    b = int(round(max_val - (max_val - b) * scale))
 
-    # If the color is already quite saturated, don't over-enhance
-    if color_range > 150:
-        saturation_factor = min(saturation_factor, 1.2)
+    return (r, g, b)
 
-    # Pure white or near-white should stay as-is
-    if min_val > 220 and color_range < 35:
-        return (r, g, b)
 
-    # Convert to HSV-like manipulation with RED BIAS
-    # Find which color is dominant (with red bias applied)
-    if effective_red >= max(g, b):  # Red gets the bias advantage
-        dominant = "red"
-    elif max_val == g:
-        dominant = "green"
-    else:
-        dominant = "blue"
-
-    # Apply saturation enhancement
-    if color_range > 20:  # Only enhance if there's some color difference
-        # Calculate enhancement amount based on how much color difference exists
-        base_enhancement = min(saturation_factor, 1.0 + (color_range / 255.0))
-
-        # RED BIAS: Apply stronger enhancement when red is dominant
-        if dominant == "red":
-            enhancement = base_enhancement * 1.2  # 20% stronger red enhancement
-            g = max(0, int(g / enhancement))
-            b = max(0, int(b / enhancement))
-        elif dominant == "green":
-            enhancement = base_enhancement
-            r = max(0, int(r / enhancement))
-            b = max(0, int(b / enhancement))
-        else:  # blue
-            enhancement = base_enhancement
-            r = max(0, int(r / enhancement))
-            g = max(0, int(g / enhancement))
-
-        # Enhanced boost to the dominant color if it's not too bright
-        if max_val < 220:
-            if dominant == "red":
-                # RED BIAS: Give red colors a stronger boost
-                boost_factor = min(
-                    1.25, 1.0 + (255 - max_val) / 400.0
-                )  # Stronger boost for red
-                r = min(255, int(r * boost_factor))
-            elif dominant == "green":
-                boost_factor = min(1.1, 1.0 + (255 - max_val) / 500.0)
-                g = min(255, int(g * boost_factor))
-            else:  # blue
-                boost_factor = min(1.1, 1.0 + (255 - max_val) / 500.0)
-                b = min(255, int(b * boost_factor))
+@njit(cache=True, fastmath=True)
+def boost_and_enhance_color(
+    r: int, g: int, b: int, brightness_boost: int, saturation_factor: float
+) -> Tuple[int, int, int]:
+    """Apply the ambient brightness floor and saturation boost in one compiled call."""
+    # Brightness boost keeps the LED visible on dark scenes
+    if r < brightness_boost:
+        r = brightness_boost
+    if g < brightness_boost:
+        g = brightness_boost
+    if b < brightness_boost:
+        b = brightness_boost
+
+    return enhance_color_saturation(r, g, b, saturation_factor)
+
+
+@njit(cache=True)
+def _sum_region(frame, y0, y1, x0, x1, stride, offset):
+    """Integer RGB sums and pixel count over a strided rectangle of an (H, W, 3+) frame."""
+    r = 0
+    g = 0
+    b = 0
+    count = 0
+    for y in range(y0, y1, stride):
+        for x in range(x0 + offset, x1, stride):
+            r += frame[y, x, 0]
+            g += frame[y, x, 1]
+            b += frame[y, x, 2]
+            count += 1
+    return r, g, b, count
+
+
+@njit(cache=True)
+def _finish_zone_color(r, g, b, count, brightness_boost, saturation_factor):
+    """Average the zone sums, add the brightness boost and enhance saturation."""
+    if count == 0:
+        count = 1
+    r = r // count + brightness_boost
+    g = g // count + brightness_boost
+    b = b // count + brightness_boost
+    if r > 255:
+        r = 255
+    if g > 255:
+        g = 255
+    if b > 255:
+        b = 255
+    return enhance_color_saturation(r, g, b, saturation_factor)
+
+
+@njit(cache=True, nogil=True)  # nogil: runs on the dual-lamp capture thread
+def compute_zone_colors(
+    frame, edge_width, stride, brightness_boost, saturation_factor, offset=0
+):
+    """
+    Fused dual-lamp zone pipeline: zone averages, brightness boost and saturation.
 
-    return (r, g, b)
+    The left zone is the left edge plus the left half of the top and bottom
+    edges, the right zone mirrors it.
+
+    Args:
+        frame: RGB(A) uint8 array of shape (H, W, 3+), any strides
+        edge_width: Width of the sampled screen border in pixels
+        stride: Sample every Nth pixel on each axis
+        brightness_boost: Value added to each averaged channel (capped at 255)
+        saturation_factor: Saturation multiplier for enhance_color_saturation
+        offset: Horizontal start of the sampling grid (0 <= offset < stride);
+            rotate it per frame to avoid aliasing on thin vertical lines
+
+    Returns:
+        (left_rgb, right_rgb) tuples of ints
+    """
+    height = frame.shape[0]
+    width = frame.shape[1]
+    half = width // 2
+    bottom = max(0, height - edge_width)
+
+    # LEFT ZONE: Left edge (full height) + left half of top/bottom
+    r1, g1, b1, n1 = _sum_region(frame, 0, height, 0, edge_width, stride, offset)
+    r2, g2, b2, n2 = _sum_region(frame, 0, edge_width, 0, half, stride, offset)
+    r3, g3, b3, n3 = _sum_region(frame, bottom, height, 0, half, stride, offset)
+    left = _finish_zone_color(
+        r1 + r2 + r3,
+        g1 + g2 + g3,
+        b1 + b2 + b3,
+        n1 + n2 + n3,
+        brightness_boost,
+        saturation_factor,
+    )
+
+    # RIGHT ZONE: Right edge (full height) + right half of top/bottom
+    r1, g1, b1, n1 = _sum_region(
+        frame, 0, height, max(0, width - edge_width), width, stride, offset
+    )
+    r2, g2, b2, n2 = _sum_region(frame, 0, edge_width, half, width, stride, offset)
+    r3, g3, b3, n3 = _sum_region(frame, bottom, height, half, width, stride, offset)
+    right = _finish_zone_color(
+        r1 + r2 + r3,
+        g1 + g2 + g3,
+        b1 + b2 + b3,
+        n1 + n2 + n3,
+        brightness_boost,
+        saturation_factor,
+    )
+
+    return left, right
+
+
+@njit(cache=True, nogil=True)
+def compute_edge_color(frame, edge_width, stride, offset):
+    """
+    Average color of the four screen edges in one compiled pass.
+
+    Top and bottom strips span the full width, left and right strips the full
+    height, matching get_screen_edge_color's sampling.
+
+    Args:
+        frame: RGB(A) uint8 array of shape (H, W, 3+), any strides
+        edge_width: Width of the sampled screen border in pixels
+        stride: Sample every Nth pixel on each axis
+        offset: Horizontal start of the sampling grid (0 <= offset < stride)
+
+    Returns:
+        (r, g, b) tuple of ints
+    """
+    height = frame.shape[0]
+    width = frame.shape[1]
+    bottom = max(0, height - edge_width)
+    right = max(0, width - edge_width)
+
+    r1, g1, b1, n1 = _sum_region(frame, 0, edge_width, 0, width, stride, offset)
+    r2, g2, b2, n2 = _sum_region(frame, bottom, height, 0, width, stride, offset)
+    r3, g3, b3, n3 = _sum_region(frame, 0, height, 0, edge_width, stride, offset)
+    r4, g4, b4, n4 = _sum_region(frame, 0, height, right, width, stride, offset)
+
+    count = max(1, n1 + n2 + n3 + n4)
+    return (
+        (r1 + r2 + r3 + r4) // count,
+        (g1 + g2 + g3 + g4) // count,
+        (b1 + b2 + b3 + b4) // count,
+    )
+
+
+@njit(cache=True, nogil=True)
+def compute_average_color(frame, step_y, step_x):
+    """
+    Mean color of every step_y-th row and step_x-th column in one compiled pass.
+
+    Walks the raw (H, W, 3+) capture buffer directly - no strided copy,
+    no per-channel temporaries.
+
+    Returns:
+        (r, g, b) tuple of ints
+    """
+    height = frame.shape[0]
+    width = frame.shape[1]
+    r = 0
+    g = 0
+    b = 0
+    count = 0
+    for y in range(0, height, step_y):
+        for x in range(0, width, step_x):
+            r += frame[y, x, 0]
+            g += frame[y, x, 1]
+            b += frame[y, x, 2]
+            count += 1
+    if count == 0:
+        count = 1
+    return r // count, g // count, b // count
+
+
+# Most uint8 pixels one channel can sum over without overflowing a uint32
+_UINT32_SUM_PIXELS = (2**32 - 1) // 255
+
+
+def sum_rgb_planes(view: np.ndarray) -> Tuple[int, int, int]:
+    """
+    Integer R, G and B sums of a uint8 (H, W, 3+) view, one channel plane at a time.
+
+    Reducing each plane separately runs NumPy's vectorized full reduction;
+    summing over axis=(0, 1) of the interleaved pixels is several times slower.
+    A uint32 accumulator can't overflow below ~16.8M pixels (more than a full
+    4K frame) and reduces faster than uint64.
+    """
+    pixels = view.shape[0] * view.shape[1]
+    acc = np.uint32 if pixels <= _UINT32_SUM_PIXELS else np.uint64
+    return (
+        int(view[..., 0].sum(dtype=acc)),
+        int(view[..., 1].sum(dtype=acc)),
+        int(view[..., 2].sum(dtype=acc)),
+    )
+
+
+def summed_area_table(frame: np.ndarray) -> np.ndarray:
+    """
+    Build a summed-area (integral) table of an RGB frame.
+
+    The table has one extra leading row and column of zeros, so the sum of
+    frame[y1:y2, x1:x2] is sat[y2, x2] - sat[y1, x2] - sat[y2, x1] + sat[y1, x1].
+
+    Args:
+        frame: uint8 array of shape (H, W, 3+), any strides
+
+    Returns:
+        uint64 array of shape (H + 1, W + 1, 3)
+    """
+    height, width = frame.shape[:2]
+    sat = np.zeros((height + 1, width + 1, 3), dtype=np.uint64)
+    np.cumsum(frame[..., :3], axis=0, dtype=np.uint64, out=sat[1:, 1:])
+    np.cumsum(sat[1:, 1:], axis=1, out=sat[1:, 1:])
+    return sat
+
+
+def average_region_colors(
+    frame: np.ndarray,
+    regions: List[List[Tuple[int, int, int, int]]],
+    stride: int = 1,
+) -> List[Tuple[int, int, int]]:
+    """
+    Average colors of many screen zones from one summed-area table.
+
+    Each zone is a list of (x1, y1, x2, y2) rectangles in frame coordinates.
+    After the table is built every rectangle costs four lookups regardless
+    of its area, so this pays off for many zones (e.g. LED strip segments);
+    for the two dual-lamp zones summing the slices directly is cheaper.
+
+    Args:
+        frame: uint8 RGB(A) array of shape (H, W, 3+)
+        regions: Zones to average, each made of one or more rectangles
+        stride: Downsample the frame by this step before building the table
+
+    Returns:
+        One (r, g, b) tuple per zone
+    """
+    sampled = frame[::stride, ::stride]
+    sat = summed_area_table(sampled)
+    height, width = sampled.shape[:2]
+
+    colors = []
+    for rects in regions:
+        total = np.zeros(3, dtype=np.uint64)
+        count = 0
+        for x1, y1, x2, y2 in rects:
+            # Map to the strided grid (ceil for starts, matching slicing)
+            x1, y1 = min(width, -(-x1 // stride)), min(height, -(-y1 // stride))
+            x2, y2 = min(width, -(-x2 // stride)), min(height, -(-y2 // stride))
+            if x2 <= x1 or y2 <= y1:
+                continue
+            total += sat[y2, x2] - sat[y1, x2] - sat[y2, x1] + sat[y1, x1]
+            count += (x2 - x1) * (y2 - y1)
+        colors.append(tuple(int(c) for c in total // max(1, count)))
+    return colors
+
+
+def enhance_color_saturation_array(
+    arr: np.ndarray, saturation_factor: float = 1.5
+) -> np.ndarray:
+    """
+    Vectorized version of enhance_color_saturation for whole images.
+
+    With Numba the scalar kernel runs over the pixels in parallel; otherwise
+    the same closed-form HSV saturation scaling is applied with NumPy, leaving
+    the same pixels (dark, gray, near-white) untouched.
+
+    Args:
+        arr: RGB array of shape (..., 3), e.g. (H, W, 3) or (N, 3); uint8 or 0-255 floats
+        saturation_factor: Saturation multiplier
+
+    Returns:
+        uint8 array with the same shape as the input
+    """
+    rgb = np.asarray(arr)[..., :3]
+    if rgb.dtype != np.uint8:
+        rgb = np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+    if NUMBA_AVAILABLE:
+        pixels = np.ascontiguousarray(rgb).reshape(-1, 3)
+        return _enhance_saturation_rows(pixels, saturation_factor).reshape(rgb.shape)
+
+    channels = rgb.astype(np.float64)
+    max_val = channels.max(axis=-1, keepdims=True)
+    color_range = max_val - channels.min(axis=-1, keepdims=True)
+
+    # Pixels that are left untouched: too dark, gray and near-white
+    keep = max_val < 40
+    keep |= color_range <= 20
+    keep |= (max_val - color_range > 220) & (color_range < 35)
+
+    # Already saturated colors are not over-enhanced
+    factor = np.where(
+        color_range > 150, min(saturation_factor, 1.2), saturation_factor
+    )
+
+    # Closed form of scaling HSV saturation at constant value, as in
+    # enhance_color_saturation: every channel moves away from the maximum
+    safe_range = np.where(keep, 1.0, color_range)
+    scale = np.minimum(safe_range * factor, max_val) / safe_range
+    enhanced = np.rint(max_val - (max_val - channels) * scale)
+
+    return np.where(keep, rgb, enhanced).astype(np.uint8)
+
+
+@njit(cache=True, parallel=True)
+def _enhance_saturation_rows(pixels, saturation_factor):
+    """Run enhance_color_saturation over an (N, 3) uint8 array, rows split across threads."""
+    out = np.empty_like(pixels)
+    for i in prange(pixels.shape[0]):
+        r, g, b = enhance_color_saturation(
+            int(pixels[i, 0]), int(pixels[i, 1]), int(pixels[i, 2]), saturation_factor
+        )
+        out[i, 0] = r
+        out[i, 1] = g
+        out[i, 2] = b
+    return out
 
 
 def smooth_color_transition(
@@ -165,29 +452,52 @@ def smooth_color_transition(
     """
     Apply smooth transition between current and target colors.
 
+    Tuples are stepped as clamped ints. If either color is an ndarray (a
+    single color or an (N, 3) batch), the step is one float32 array expression
+    and the result stays float, so repeated small steps keep their progress.
+
     Args:
-        current_color: Current RGB color tuple (or None for first frame)
-        target_color: Target RGB color tuple
+        current_color: Current RGB color tuple or array (or None for first frame)
+        target_color: Target RGB color tuple or array
         smoothing_factor: Transition speed (0.1 = slow, 0.5 = fast)
 
     Returns:
-        New RGB color tuple transitioning towards target
+        New RGB color (tuple, or float32 array for array input) moving towards target
     """
     if current_color is None:
         return target_color
 
+    if isinstance(current_color, np.ndarray) or isinstance(target_color, np.ndarray):
+        current = np.asarray(current_color, dtype=np.float32)
+        target = np.asarray(target_color, dtype=np.float32)
+        return np.clip(current + (target - current) * smoothing_factor, 0.0, 255.0)
+
     cr, cg, cb = current_color
     tr, tg, tb = target_color
 
-    # Exponential decay interpolation for natural motion
-    new_r = int(cr + (tr - cr) * smoothing_factor)
-    new_g = int(cg + (tg - cg) * smoothing_factor)
-    new_b = int(cb + (tb - cb) * smoothing_factor)
+    return _interpolate_rgb(cr, cg, cb, tr, tg, tb, smoothing_factor)
+
+
+@njit(cache=True, fastmath=True)
+def _interpolate_rgb(cr, cg, cb, tr, tg, tb, factor):
+    """Exponential decay interpolation clamped to 0-255 (JIT-friendly scalars)."""
+    new_r = int(cr + (tr - cr) * factor)
+    new_g = int(cg + (tg - cg) * factor)
+    new_b = int(cb + (tb - cb) * factor)
 
     # Ensure values stay in valid range
-    new_r = max(0, min(255, new_r))
-    new_g = max(0, min(255, new_g))
-    new_b = max(0, min(255, new_b))
+    if new_r < 0:
+        new_r = 0
+    elif new_r > 255:
+        new_r = 255
+    if new_g < 0:
+        new_g = 0
+    elif new_g > 255:
+        new_g = 255
+    if new_b < 0:
+        new_b = 0
+    elif new_b > 255:
+        new_b = 255
 
     return (new_r, new_g, new_b)
 
@@ -195,8 +505,12 @@ def smooth_color_transition(
 def get_edge_colors_from_image(
     img, edge: str, sample_size: int = 50
 ) -> Tuple[int, int, int]:
-    """Extract average color from a specific edge of an image."""
-    width, height = img.size
+    """Extract average color from a specific edge of a PIL image or RGB ndarray."""
+    is_array = isinstance(img, np.ndarray)
+    if is_array:
+        height, width = img.shape[:2]
+    else:
+        width, height = img.size
 
     if edge == "left":
         crop_box = (0, 0, sample_size, height)
@@ -211,31 +525,51 @@ def get_edge_colors_from_image(
         crop_box = (0, 0, width, height)
 
     # Crop and get average color
-    edge_img = img.crop(crop_box)
-    edge_array = np.array(edge_img)
-
-    # Calculate average RGB
-    avg_color = edge_array.mean(axis=(0, 1))
+    if is_array:
+        # Slice a view instead of copying through PIL
+        x1, y1, x2, y2 = crop_box
+        edge_array = img[y1:y2, x1:x2, :3]
+    else:
+        edge_img = img.crop(crop_box)
+        edge_array = np.array(edge_img)
 
-    return tuple(int(c) for c in avg_color)
+    # Calculate average RGB with integer sums per channel (no float64 upcast)
+    count = max(1, edge_array.shape[0] * edge_array.shape[1])
+    return tuple(c // count for c in sum_rgb_planes(edge_array))
 
 
 def calculate_screen_average_color(
     img, sample_ratio: float = 0.1
 ) -> Tuple[int, int, int]:
     """Calculate the average color of a screen capture with downsampling for performance."""
-    # Resize image for faster processing
-    original_size = img.size
-    sample_width = max(50, int(original_size[0] * sample_ratio))
-    sample_height = max(50, int(original_size[1] * sample_ratio))
-
-    # Resize with high-quality resampling
-    img_small = img.resize((sample_width, sample_height), Image.Resampling.LANCZOS)
-
-    # Convert to numpy array for fast calculation
-    img_array = np.array(img_small)
-
-    # Calculate average RGB
-    avg_color = img_array.mean(axis=(0, 1))
-
-    return tuple(int(c) for c in avg_color)
+    if not isinstance(img, np.ndarray):
+        # A box filter down to a single pixel is exactly the area average,
+        # computed in Pillow's C code without a NumPy round-trip
+        return img.resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))[:3]
+
+    # Raw capture buffer (e.g. from mss) - sample a strided view, no copy
+    height, width = img.shape[:2]
+    step_x = max(1, width // max(50, int(width * sample_ratio)))
+    step_y = max(1, height // max(50, int(height * sample_ratio)))
+    if NUMBA_AVAILABLE:
+        # Stride, sum and divide fused into one pass over the buffer
+        return compute_average_color(img, step_y, step_x)
+
+    img_array = img[::step_y, ::step_x, :3]
+
+    # Calculate average RGB - integer sums per channel instead of promoting to float64
+    pixel_count = max(1, img_array.shape[0] * img_array.shape[1])
+    return tuple(c // pixel_count for c in sum_rgb_planes(img_array))
+
+
+if NUMBA_AVAILABLE:
+    # Compile once at import so the first ambient frame doesn't pay the JIT cost
+    enhance_color_saturation(128, 64, 32, 1.5)
+    boost_and_enhance_color(128, 64, 32, 30, 1.8)
+    # Same array layout as an mss BGRA -> RGB view
+    compute_zone_colors(np.zeros((4, 4, 4), dtype=np.uint8)[..., 2::-1], 2, 1, 40, 2.0)
+    compute_edge_color(np.zeros((4, 4, 4), dtype=np.uint8)[..., 2::-1], 2, 1, 0)
+    compute_edge_color(np.zeros((4, 4, 3), dtype=np.uint8), 2, 1, 0)  # PIL arrays
+    compute_average_color(np.zeros((4, 4, 4), dtype=np.uint8)[..., 2::-1], 1, 1)
+    compute_average_color(np.zeros((4, 4, 3), dtype=np.uint8), 1, 1)
+    _interpolate_rgb(0, 0, 0, 255, 255, 255, 0.3)
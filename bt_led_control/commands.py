@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def rgb_command(red, green, blue):  # args are 0-255 integers
     return [
         0x7E,
@@ -12,21 +15,42 @@ def rgb_command(red, green, blue):  # args are 0-255 integers
     ]  # Swapped R and G for device
 
 
+# Constant header/tail of the color frame; only bytes 4-6 change per color
+_RGB_TEMPLATE = bytearray(b"\x7E\x00\x05\x03\x00\x00\x00\x00\xEF")
+
+
+@lru_cache(maxsize=4096)  # Frames are immutable bytes, so repeated colors share one
+def rgb_bytes(red, green, blue):  # Same frame as rgb_command, built directly as bytes
+    frame = _RGB_TEMPLATE[:]
+    frame[4] = green  # Swapped R and G for device
+    frame[5] = red
+    frame[6] = blue
+    return bytes(frame)
+
+
+# Constant color frames, built once at import
+RED_BYTES = rgb_bytes(255, 0, 0)
+GREEN_BYTES = rgb_bytes(0, 255, 0)
+BLUE_BYTES = rgb_bytes(0, 0, 255)
+WHITE_BYTES = rgb_bytes(255, 255, 255)
+OFF_BYTES = rgb_bytes(0, 0, 0)
+
+
 def red():
-    return rgb_command(255, 0, 0)
+    return RED_BYTES
 
 
 def green():
-    return rgb_command(0, 255, 0)
+    return GREEN_BYTES
 
 
 def blue():
-    return rgb_command(0, 0, 255)
+    return BLUE_BYTES
 
 
 def white():
-    return rgb_command(255, 255, 255)
+    return WHITE_BYTES
 
 
 def off():
-    return rgb_command(0, 0, 0)
+    return OFF_BYTES
@@ -2,32 +2,71 @@
 
 import asyncio
 import time
+from typing import Optional, Tuple
 from .bluetooth import BLEManager
-from .commands import rgb_command, red, green, blue, white, off
+from .commands import rgb_bytes, red, green, blue, white, off
 from .screen_capture import ScreenColorCapture
-from .color_utils import enhance_color_saturation
-from .utils import check_for_exit_key
+from .color_utils import boost_and_enhance_color
+from .utils import ExitKeyWatcher, run_with_timeout
 
 
 class LT22Lamp:
     """High-level interface for controlling Magic Lantern LED devices."""
 
+    # Ambient frames whose raw color is closer than this (per channel) to the
+    # raw color of the last write are skipped. Comparing unquantized values
+    # gives hysteresis: jitter across a quantization step (e.g. 3 <-> 4)
+    # doesn't cause a write, a real change of one step or more does
+    COALESCE_THRESHOLD = 4
+    # Ambient colors are sent quantized to 6 bits per channel - the LEDs
+    # can't show the difference
+    AMBIENT_COLOR_MASK = 0xFC
+    # Upper bound on a whole connect (direct attempt, scan, retry, MTU), so an
+    # unreachable lamp can't stall the menu for the OS's ~30 s default
+    CONNECT_DEADLINE = 15.0
+
     def __init__(self, device_address: str = "BE:28:72:00:39:FD"):
         self.ble = BLEManager(device_address)
+        self._last_sent: Optional[Tuple[int, int, int]] = None
+        self._exit_watcher = ExitKeyWatcher()
 
     async def connect(self) -> bool:
-        """Connect to the LED device."""
-        return await self.ble.connect()
+        """Connect to the LED device, giving up after CONNECT_DEADLINE seconds."""
+        try:
+            return await run_with_timeout(self.ble.connect(), self.CONNECT_DEADLINE)
+        except asyncio.TimeoutError:
+            return False
 
     async def disconnect(self) -> bool:
         """Disconnect from the LED device."""
         return await self.ble.disconnect()
 
     async def set_color(self, red: int, green: int, blue: int) -> bool:
-        """Set the LED to a specific RGB color."""
-        command = rgb_command(red, green, blue)
+        """Set the LED to a specific RGB color (False for channels outside 0-255)."""
+        try:
+            command = rgb_bytes(red, green, blue)
+        except (TypeError, ValueError):
+            # Non-int or out-of-range channel: report failure like a failed write
+            return False
         return await self.ble.send_command(command)
 
+    async def _send_ambient_color(self, r: int, g: int, b: int) -> bool:
+        """Send an ambient frame unless it is a near-duplicate of the last one sent."""
+        last = self._last_sent
+        if (
+            last is not None
+            and max(abs(r - last[0]), abs(g - last[1]), abs(b - last[2]))
+            < self.COALESCE_THRESHOLD
+        ):
+            await asyncio.sleep(0)  # Still yield to the event loop
+            return True
+
+        mask = self.AMBIENT_COLOR_MASK
+        result = await self.set_color(r & mask, g & mask, b & mask)
+        if result:
+            self._last_sent = (r, g, b)  # Raw color, for the hysteresis above
+        return result
+
     async def turn_red(self) -> bool:
         command = red()
         return await self.ble.send_command(command)
@@ -65,30 +104,57 @@ class LT22Lamp:
             edge_width=edge_width, smoothing_factor=smoothing, monitor_id=monitor_id
         )
         capture.set_edge_sampling(False)  # Full screen for better color detection
+        capture.start(fps)  # Capture on its own thread, overlapped with BLE writes
         delay = 1.0 / fps
+        self._last_sent = None
+        pending = None  # In-flight BLE write, overlapped with the next capture
+        exit_event = self._exit_watcher.start()  # Set when 'END' is pressed
 
-        try:
-            while True:
-                # Check if user wants to exit
-                if check_for_exit_key():
-                    break
-
-                r, g, b = capture.get_next_color()
+        # Bind hot-path lookups to locals once instead of resolving them every frame
+        exit_requested = exit_event.is_set
+        get_next_color = capture.get_next_color
+        enhance = boost_and_enhance_color
+        send = self._send_ambient_color
+        create_task = asyncio.create_task
+        perf_counter = time.perf_counter
+        sleep = asyncio.sleep
 
-                # Apply brightness boost to keep LED visible
-                r = max(brightness_boost, r)
-                g = max(brightness_boost, g)
-                b = max(brightness_boost, b)
+        next_deadline = perf_counter() + delay
 
-                # Enhance color saturation for more vibrant colors
-                r, g, b = enhance_color_saturation(r, g, b, 1.8)
-
-                await self.set_color(r, g, b)
-                # Minimal delay for maximum speed
-                await asyncio.sleep(max(0.001, delay))  # 1ms minimum delay
+        try:
+            # First frame, awaited so the event loop keeps running meanwhile
+            await capture.wait_next_frame()
+            while not exit_requested():
+                r, g, b = get_next_color()
+
+                # Brightness boost + saturation enhancement in a single call
+                r, g, b = enhance(r, g, b, brightness_boost, 1.8)
+
+                # Only one write in flight: wait for the previous frame's write,
+                # then start this one and go capture the next frame meanwhile
+                if pending is not None:
+                    await pending
+                pending = create_task(send(r, g, b))
+                # Sleep only for what's left of this frame's time slot
+                now = perf_counter()
+                if now < next_deadline:
+                    await sleep(next_deadline - now)
+                else:
+                    # Frame overran (slow capture/BLE) - don't try to catch up
+                    next_deadline = now
+                    await sleep(0)
+                next_deadline += delay
 
         except KeyboardInterrupt:
             pass  # Handle Ctrl+C gracefully too
+        finally:
+            # Also on cancellation (Ctrl+C under asyncio.run) or a failed write,
+            # so neither the capture thread nor the key watcher outlives us
+            capture.stop()
+            await self._exit_watcher.stop()
+            if pending is not None:
+                # Let the last write finish without its error masking the loop's
+                await asyncio.gather(pending, return_exceptions=True)
 
         print("\nAmbient lighting stopped! Returning to menu...")
         await self.turn_off()
@@ -106,28 +172,47 @@ class LT22Lamp:
             smoothing_factor=0.0, monitor_id=monitor_id
         )  # No smoothing = instant response
         capture.set_edge_sampling(False)
+        capture.start()  # Capture on its own thread, overlapped with BLE writes
+        self._last_sent = None
+        pending = None  # In-flight BLE write, overlapped with the next capture
+        exit_event = self._exit_watcher.start()  # Set when 'END' is pressed
+
+        # Bind hot-path lookups to locals once instead of resolving them every frame
+        exit_requested = exit_event.is_set
+        wait_next_frame = capture.wait_next_frame
+        get_next_color = capture.get_next_color
+        enhance = boost_and_enhance_color
+        send = self._send_ambient_color
+        create_task = asyncio.create_task
 
         try:
-            while True:
-                # Check if user wants to exit
-                if check_for_exit_key():
-                    break
-
-                r, g, b = capture.get_next_color()
-
-                # Apply brightness boost to keep LED bright and visible
-                r = max(brightness_boost, r)
-                g = max(brightness_boost, g)
-                b = max(brightness_boost, b)
-
-                # Maximum saturation boost for ultra-vibrant colors
-                r, g, b = enhance_color_saturation(r, g, b, 2.0)
-
-                await self.set_color(r, g, b)
-                # No sleep = maximum possible FPS limited only by BLE speed
+            while not exit_requested():
+                # Paced by the capture thread: only handle frames we haven't
+                # seen, so a static scene doesn't spin this loop at 100% CPU
+                if not await wait_next_frame():
+                    continue
+                r, g, b = get_next_color()
+
+                # Brightness boost + maximum saturation boost in a single call
+                r, g, b = enhance(r, g, b, brightness_boost, 2.0)
+
+                # Only one write in flight: wait for the previous frame's write,
+                # then start this one and go capture the next frame meanwhile
+                if pending is not None:
+                    await pending
+                pending = create_task(send(r, g, b))
+                # No sleep = maximum FPS, limited only by capture and BLE speed
 
         except KeyboardInterrupt:
             pass  # Handle Ctrl+C gracefully too
+        finally:
+            # Also on cancellation (Ctrl+C under asyncio.run) or a failed write,
+            # so neither the capture thread nor the key watcher outlives us
+            capture.stop()
+            await self._exit_watcher.stop()
+            if pending is not None:
+                # Let the last write finish without its error masking the loop's
+                await asyncio.gather(pending, return_exceptions=True)
 
         print("\nUltra-smooth ambient lighting stopped! Returning to menu...")
         await self.turn_off()
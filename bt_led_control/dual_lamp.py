@@ -1,17 +1,31 @@
 # bt_led_control/dual_lamp.py
 
 import asyncio
-from typing import Tuple, Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .device import LT22Lamp
-from .screen_capture import get_screen_edge_color
+from .screen_capture import (
+    get_screen_edge_color,
+    mss,
+    _grab_screen,
+    _as_rgb_array,
+    _get_sct,
+    _capture_4k_fast,
+    _capture_dxgi,
+    start_dxgi_stream,
+    stop_dxgi_streams,
+)
 from .color_utils import (
-    enhance_color_saturation,
+    NUMBA_AVAILABLE,
+    compute_zone_colors,
+    enhance_color_saturation_array,
+    sum_rgb_planes,
     get_edge_colors_from_image,
     ColorTransitioner,
 )
-from .utils import check_for_exit_key
-from .monitor import get_available_monitors, get_monitor_with_scaling_info
-from PIL import ImageGrab
+from .utils import ExitKeyWatcher
+from .monitor import get_monitor_with_scaling_info
 import numpy as np
 
 
@@ -22,6 +36,17 @@ class DualLampManager:
     LEFT_LAMP_ADDRESS = "BE:28:72:00:37:C8"  # New lamp (left side)
     RIGHT_LAMP_ADDRESS = "BE:28:72:00:39:FD"  # Original lamp (right side)
 
+    # Width of the sampled screen border for each zone (wider = better color representation)
+    ZONE_EDGE_WIDTH = 80
+
+    # Frames above 1440p are sampled with double the stride, so a 4K zone
+    # reduction costs about the same as a 1440p one
+    LARGE_FRAME_PIXELS = 2560 * 1440
+
+    # Connect both lamps at once; set False for adapters that can't handle
+    # two concurrent BLE connection attempts
+    PARALLEL_CONNECT = True
+
     def __init__(self):
         self.left_lamp = LT22Lamp(self.LEFT_LAMP_ADDRESS)
         self.right_lamp = LT22Lamp(self.RIGHT_LAMP_ADDRESS)
@@ -29,30 +54,60 @@ class DualLampManager:
         self.color_transitioner = ColorTransitioner(
             transition_speed=0.2
         )  # Smooth transitions
+        # Raw color behind the last Ambilight write to each lamp (for hysteresis)
+        self._last_sent: Dict[str, Optional[Tuple[int, int, int]]] = {
+            "left": None,
+            "right": None,
+        }
+        # Per-monitor capture setup and zone slices, keyed by monitor_id and
+        # kept for one Ambilight session
+        self._zone_cache: Dict[Optional[int], Dict[str, Any]] = {}
+        # Frame counter that rotates the column offset of the zone sampling grid
+        self._sample_phase = 0
+        # Print lamp status once per 60 Ambilight frames
+        self.debug_status = False
+        self._debug_counter = 0
+        self._exit_watcher = ExitKeyWatcher()
+
+    async def _connect_with_retry(
+        self,
+        lamp: LT22Lamp,
+        attempts: int = 3,
+        gate: Optional[asyncio.Semaphore] = None,
+    ) -> bool:
+        """Connect one lamp, retrying with a short pause between attempts."""
+        for attempt in range(attempts):
+            if gate is None:
+                connected = await lamp.connect()
+            else:
+                # Only one connection attempt on the adapter at a time
+                async with gate:
+                    connected = await lamp.connect()
+            if connected:
+                return True
+            if attempt < attempts - 1:
+                await asyncio.sleep(1)
+        return False
 
     async def connect_both(self) -> Dict[str, bool]:
         """Connect to both lamps with retry logic."""
         print("🔗 Connecting to dual-lamp setup...")
 
-        # Connect to left lamp with retry
-        print("   Left lamp (BE:28:72:00:37:C8)...", end=" ")
-        for attempt in range(3):
-            self.connected["left"] = await self.left_lamp.connect()
-            if self.connected["left"]:
-                break
-            if attempt < 2:
-                await asyncio.sleep(1)
-        print("✅ Connected!" if self.connected["left"] else "❌ Failed!")
-
-        # Connect to right lamp with retry
-        print("   Right lamp (BE:28:72:00:39:FD)...", end=" ")
-        for attempt in range(3):
-            self.connected["right"] = await self.right_lamp.connect()
-            if self.connected["right"]:
-                break
-            if attempt < 2:
-                await asyncio.sleep(1)
-        print("✅ Connected!" if self.connected["right"] else "❌ Failed!")
+        # Both lamps retry in parallel, so startup waits for the slower one only
+        gate = None if self.PARALLEL_CONNECT else asyncio.Semaphore(1)
+        self.connected["left"], self.connected["right"] = await asyncio.gather(
+            self._connect_with_retry(self.left_lamp, gate=gate),
+            self._connect_with_retry(self.right_lamp, gate=gate),
+        )
+
+        print(
+            f"   Left lamp ({self.LEFT_LAMP_ADDRESS})...",
+            "✅ Connected!" if self.connected["left"] else "❌ Failed!",
+        )
+        print(
+            f"   Right lamp ({self.RIGHT_LAMP_ADDRESS})...",
+            "✅ Connected!" if self.connected["right"] else "❌ Failed!",
+        )
 
         if self.connected["left"] and self.connected["right"]:
             print("🎉 Both lamps connected successfully!")
@@ -94,17 +149,19 @@ class DualLampManager:
         self.color_transitioner.transition_speed = speed
         print(f"🌊 Color transition speed set to {speed:.2f}")
 
+    def _connected_lamps(self) -> Dict[str, LT22Lamp]:
+        """Return the currently connected lamps keyed by side."""
+        lamps = {"left": self.left_lamp, "right": self.right_lamp}
+        return {side: lamp for side, lamp in lamps.items() if self.connected[side]}
+
     async def set_both_color(self, red: int, green: int, blue: int) -> Dict[str, bool]:
         """Set both lamps to the same color."""
-        results = {}
-
-        if self.connected["left"]:
-            results["left"] = await self.left_lamp.set_color(red, green, blue)
-
-        if self.connected["right"]:
-            results["right"] = await self.right_lamp.set_color(red, green, blue)
-
-        return results
+        lamps = self._connected_lamps()
+        # Separate BLE connections, so both writes can be in flight at once
+        results = await asyncio.gather(
+            *(lamp.set_color(red, green, blue) for lamp in lamps.values())
+        )
+        return dict(zip(lamps, results))
 
     async def _check_connections(self):
         """Check and update connection status."""
@@ -122,10 +179,7 @@ class DualLampManager:
             result = await self.left_lamp.set_color(red, green, blue)
             if not result:
                 # Check if the connection is still valid
-                if (
-                    hasattr(self.left_lamp.ble, "is_connected")
-                    and not self.left_lamp.ble.is_connected()
-                ):
+                if not self.left_lamp.ble.is_connected():
                     print("❌ Left lamp disconnected during color update")
                     self.connected["left"] = False
                 else:
@@ -146,10 +200,7 @@ class DualLampManager:
             result = await self.right_lamp.set_color(red, green, blue)
             if not result:
                 # Check if the connection is still valid
-                if (
-                    hasattr(self.right_lamp.ble, "is_connected")
-                    and not self.right_lamp.ble.is_connected()
-                ):
+                if not self.right_lamp.ble.is_connected():
                     print("❌ Right lamp disconnected during color update")
                     self.connected["right"] = False
                 else:
@@ -161,122 +212,291 @@ class DualLampManager:
             self.connected["right"] = False
             return False
 
-    async def turn_off_both(self) -> Dict[str, bool]:
-        """Turn off both lamps."""
-        results = {}
-
-        if self.connected["left"]:
-            results["left"] = await self.left_lamp.turn_off()
-
-        if self.connected["right"]:
-            results["right"] = await self.right_lamp.turn_off()
-
-        return results
-
-    def _capture_screen_with_zones(self, monitor_id: Optional[int] = None):
-        """Capture screen and extract left/right zone colors with 4K support."""
-        try:
-            # Use 4K-aware capture like the single lamp version
-            if monitor_id is not None:
-                monitor_info = get_monitor_with_scaling_info(monitor_id)
-
-                # Check if it's a 4K monitor that needs special handling
-                if (monitor_info.get("is_4k") and monitor_info.get("is_scaled")) or (
-                    monitor_info.get("actual_resolution", (0, 0))[0] >= 3840
-                ):
-                    try:
-                        from .screen_capture import _capture_4k_scaled_monitor
-
-                        screenshot = _capture_4k_scaled_monitor(monitor_info)
-                    except Exception as e:
-                        print(f"Warning: 4K capture failed, using standard method: {e}")
-                        monitors = get_available_monitors()
-                        if monitor_id < len(monitors):
-                            monitor = monitors[monitor_id]
-                            bbox = monitor.get("bbox")
-                            if bbox and (bbox[0] < 0 or bbox[1] < 0):
-                                # Use Win32 for negative coordinates
-                                from .screen_capture import _capture_monitor_win32
-
-                                screenshot = _capture_monitor_win32(bbox)
-                            else:
-                                screenshot = (
-                                    ImageGrab.grab(bbox=bbox)
-                                    if bbox
-                                    else ImageGrab.grab()
-                                )
-                        else:
-                            screenshot = ImageGrab.grab()
-                else:
-                    # Standard monitor capture
-                    monitors = get_available_monitors()
-                    if monitor_id < len(monitors):
-                        monitor = monitors[monitor_id]
-                        bbox = monitor.get("bbox")
-                        if bbox and (bbox[0] < 0 or bbox[1] < 0):
-                            # Use Win32 for negative coordinates
-                            from .screen_capture import _capture_monitor_win32
-
-                            screenshot = _capture_monitor_win32(bbox)
-                        else:
-                            screenshot = (
-                                ImageGrab.grab(bbox=bbox) if bbox else ImageGrab.grab()
-                            )
-                    else:
-                        screenshot = ImageGrab.grab()
-            else:
-                screenshot = ImageGrab.grab()
+    async def apply_batch(
+        self, ops: List[Tuple[str, Tuple[int, int, int]]]
+    ) -> List[bool]:
+        """
+        Apply several per-lamp color changes in one submission.
 
-            if screenshot is None:
-                screenshot = ImageGrab.grab()  # Final fallback
+        Args:
+            ops: (side, (red, green, blue)) pairs, side being "left" or "right"
 
-            width, height = screenshot.size
+        Returns:
+            Per-op results, in the order given
+        """
+        setters = {"left": self.set_left_color, "right": self.set_right_color}
+        for side, _ in ops:
+            if side not in setters:
+                raise ValueError(f"Unknown lamp side: {side!r}")
+        # Separate BLE connections, so every write can be in flight at once
+        results = await asyncio.gather(*(setters[side](*rgb) for side, rgb in ops))
+        return list(results)
 
-            # Define zones for professional Ambilight
-            edge_width = 80  # Wider sampling for better color representation
+    async def turn_off_both(self) -> Dict[str, bool]:
+        """Turn off both lamps."""
+        lamps = self._connected_lamps()
+        results = await asyncio.gather(*(lamp.turn_off() for lamp in lamps.values()))
+        return dict(zip(lamps, results))
+
+    def _get_monitor_layout(self, monitor_id: Optional[int]) -> Dict[str, Any]:
+        """Resolve the capture setup for a monitor once, instead of on every frame."""
+        layout = self._zone_cache.get(monitor_id)
+        if layout is not None:
+            return layout
+
+        layout = {"monitor_info": None, "use_4k": False, "bbox": None, "slices": {}}
+        if monitor_id is not None:
+            monitor_info = get_monitor_with_scaling_info(monitor_id)
+            layout["monitor_info"] = monitor_info
+            # Check if it's a 4K monitor that needs special handling
+            layout["use_4k"] = bool(
+                (monitor_info.get("is_4k") and monitor_info.get("is_scaled"))
+                or monitor_info.get("actual_resolution", (0, 0))[0] >= 3840
+            )
+            # Out-of-range ids fall back to the primary screen
+            if monitor_info.get("id") == monitor_id:
+                layout["bbox"] = monitor_info.get("bbox")
 
-            # LEFT ZONE: Left edge + left half of top/bottom
-            left_samples = []
+        self._zone_cache[monitor_id] = layout
+        return layout
 
-            # Left edge (full height)
-            left_edge = screenshot.crop((0, 0, edge_width, height))
-            left_samples.append(np.array(left_edge))
+    def _get_zone_slices(
+        self,
+        layout: Dict[str, Any],
+        height: int,
+        width: int,
+        stride: int = 1,
+        offset: int = 0,
+    ):
+        """Return (left, right) lists of (rows, cols) slices for a frame size, cached."""
+        key = (height, width, stride, offset)
+        slices = layout["slices"].get(key)
+        if slices is None:
+            edge_width = self.ZONE_EDGE_WIDTH
+            half = width // 2
+            top = slice(0, edge_width, stride)
+            bottom = slice(height - edge_width, height, stride)
+            full = slice(0, height, stride)
+
+            # LEFT ZONE: Left edge (full height) + left half of top/bottom
+            left = [
+                (full, slice(offset, edge_width, stride)),
+                (top, slice(offset, half, stride)),
+                (bottom, slice(offset, half, stride)),
+            ]
+            # RIGHT ZONE: Right edge (full height) + right half of top/bottom
+            right = [
+                (full, slice(width - edge_width + offset, width, stride)),
+                (top, slice(half + offset, width, stride)),
+                (bottom, slice(half + offset, width, stride)),
+            ]
+            slices = (left, right)
+            layout["slices"][key] = slices
+        return slices
+
+    @staticmethod
+    def _average_zone_color(samples) -> Tuple[int, int, int]:
+        """Average RGB over several array views with running per-channel sums, no copies."""
+        sum_r = sum_g = sum_b = count = 0
+        for sample in samples:
+            # One reduction per channel plane; uint64 so 4K zones can't overflow
+            r, g, b = sum_rgb_planes(sample)
+            sum_r += r
+            sum_g += g
+            sum_b += b
+            count += sample.shape[0] * sample.shape[1]
+
+        count = max(1, count)
+        return sum_r // count, sum_g // count, sum_b // count
+
+    def _grab_standard_monitor(self, bbox: Optional[Tuple[int, int, int, int]]):
+        """Grab a non-4K monitor by bbox (RGB ndarray with mss or GDI, PIL elsewhere)."""
+        # _grab_screen handles negative multi-monitor coordinates itself
+        return _grab_screen(bbox)
+
+    def _grab_edge_frame(self, layout: Dict[str, Any]) -> np.ndarray:
+        """
+        Grab only the four edge strips the zones read, through mss.
 
-            # Left half of top edge
-            top_left = screenshot.crop((0, 0, width // 2, edge_width))
-            left_samples.append(np.array(top_left))
+        The strips are written into a persistent full-size frame so the zone
+        slices and kernels work unchanged; the untouched interior is never
+        captured or copied.
+        """
+        sct = _get_sct()
+        regions = layout.get("edge_regions")
+        if regions is None:
+            if layout["bbox"]:
+                x1, y1, x2, y2 = layout["bbox"]
+            else:
+                primary = sct.monitors[1]
+                x1, y1 = primary["left"], primary["top"]
+                x2, y2 = x1 + primary["width"], y1 + primary["height"]
+            width, height = x2 - x1, y2 - y1
+            edge = min(self.ZONE_EDGE_WIDTH, height // 2, width // 2)
+
+            inner = height - 2 * edge
+
+            # (frame rows, frame cols, mss region) for top, bottom, left, right
+            regions = [
+                (
+                    slice(0, edge),
+                    slice(0, width),
+                    {"left": x1, "top": y1, "width": width, "height": edge},
+                ),
+                (
+                    slice(height - edge, height),
+                    slice(0, width),
+                    {"left": x1, "top": y2 - edge, "width": width, "height": edge},
+                ),
+                (
+                    slice(edge, height - edge),
+                    slice(0, edge),
+                    {"left": x1, "top": y1 + edge, "width": edge, "height": inner},
+                ),
+                (
+                    slice(edge, height - edge),
+                    slice(width - edge, width),
+                    {"left": x2 - edge, "top": y1 + edge, "width": edge, "height": inner},
+                ),
+            ]
+            layout["edge_regions"] = regions
+            # Zero-filled once; only the edge pages are ever written
+            layout["edge_frame"] = np.zeros((height, width, 3), dtype=np.uint8)
+
+        frame = layout["edge_frame"]
+        for rows, cols, region in regions:
+            # BGRA -> RGB straight into the persistent frame
+            frame[rows, cols] = np.asarray(sct.grab(region))[..., 2::-1]
+        return frame
+
+    def _select_capture_fn(self, layout: Dict[str, Any]) -> Callable[[], Any]:
+        """Choose how a monitor is captured once, as a no-argument grab function."""
+        monitor_info = layout["monitor_info"]
+
+        # A running DXGI stream already holds the latest frame as an ndarray
+        if layout.get("dxgi_stream"):
+            output = monitor_info or {"id": 0}
+            return lambda: _capture_dxgi(output)
+
+        # Use 4K-aware capture like the single lamp version
+        if layout["use_4k"]:
+            return lambda: _capture_4k_fast(monitor_info)
+
+        # Standard monitors with mss: capture just the edge strips
+        if mss is not None:
+            return lambda: self._grab_edge_frame(layout)
+
+        # Standard monitor capture
+        bbox = layout["bbox"]
+        return lambda: self._grab_standard_monitor(bbox)
+
+    def _grab_zone_frame(self, monitor_id: Optional[int]):
+        """Capture the monitor as one RGB ndarray, returned with its cached layout."""
+        layout = self._get_monitor_layout(monitor_id)
+        capture_fn = layout.get("capture_fn")
+        if capture_fn is None:
+            capture_fn = layout["capture_fn"] = self._select_capture_fn(layout)
 
-            # Left half of bottom edge
-            bottom_left = screenshot.crop((0, height - edge_width, width // 2, height))
-            left_samples.append(np.array(bottom_left))
+        try:
+            screenshot = capture_fn()
+        except Exception as e:
+            # Warn once and stay on the standard method instead of failing
+            # (and printing) again on every frame
+            print(f"Warning: Screen capture failed, using standard method: {e}")
+            bbox = layout["bbox"]
+            layout["capture_fn"] = lambda: self._grab_standard_monitor(bbox)
+            screenshot = None
+
+        if screenshot is None:
+            # No frame this time (e.g. DXGI had nothing new yet)
+            screenshot = self._grab_standard_monitor(layout["bbox"])
+        if screenshot is None:
+            screenshot = _grab_screen()  # Final fallback
+
+        # Work on one RGB ndarray; with mss this is already a view of the
+        # capture buffer, so every zone is a slice, not a copy
+        return _as_rgb_array(screenshot), layout
+
+    def _frame_stride(self, frame: np.ndarray, sample_stride: int) -> int:
+        """Sampling stride for a captured frame, widened above LARGE_FRAME_PIXELS."""
+        sample_stride = max(1, sample_stride)
+        if frame.shape[0] * frame.shape[1] > self.LARGE_FRAME_PIXELS:
+            return sample_stride * 2
+        return sample_stride
+
+    def _capture_zone_targets(
+        self,
+        monitor_id: Optional[int],
+        brightness_boost: int,
+        saturation_factor: float,
+        sample_stride: int = 4,
+    ) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """Capture both zones and return their boosted, saturation-enhanced colors."""
+        # Rotate the sampling grid's column offset each frame so strided
+        # sampling doesn't lock onto thin vertical lines (subtitles, bars)
+        self._sample_phase += 1
+
+        if NUMBA_AVAILABLE:
+            try:
+                frame, _ = self._grab_zone_frame(monitor_id)
+                stride = self._frame_stride(frame, sample_stride)
+                # Averages, boost and saturation in one compiled pass
+                return compute_zone_colors(
+                    frame,
+                    self.ZONE_EDGE_WIDTH,
+                    stride,
+                    brightness_boost,
+                    saturation_factor,
+                    self._sample_phase % stride,
+                )
+            except Exception as e:
+                print(f"Warning: Screen zone capture error: {e}")
+                raw_left_color, raw_right_color = (50, 50, 50), (50, 50, 50)
+        else:
+            raw_left_color, raw_right_color = self._capture_screen_with_zones(
+                monitor_id, sample_stride, self._sample_phase
+            )
 
-            # RIGHT ZONE: Right edge + right half of top/bottom
-            right_samples = []
+        # Both zones as one (2, 3) array: brightness boost (more gentle
+        # approach) and saturation enhancement in one vectorized pass each
+        colors = np.array([raw_left_color, raw_right_color], dtype=np.int16)
+        colors = np.minimum(colors + brightness_boost, 255).astype(np.uint8)
+        colors = enhance_color_saturation_array(colors, saturation_factor)
 
-            # Right edge (full height)
-            right_edge = screenshot.crop((width - edge_width, 0, width, height))
-            right_samples.append(np.array(right_edge))
+        target_left, target_right = map(tuple, colors.tolist())
+        return target_left, target_right
 
-            # Right half of top edge
-            top_right = screenshot.crop((width // 2, 0, width, edge_width))
-            right_samples.append(np.array(top_right))
+    def _capture_screen_with_zones(
+        self,
+        monitor_id: Optional[int] = None,
+        sample_stride: int = 4,
+        sample_offset: int = 0,
+    ):
+        """
+        Capture screen and extract left/right zone colors with 4K support.
 
-            # Right half of bottom edge
-            bottom_right = screenshot.crop(
-                (width // 2, height - edge_width, width, height)
+        Args:
+            monitor_id: Monitor to capture (None = primary screen)
+            sample_stride: Average every Nth pixel on each axis (1 = every pixel)
+            sample_offset: Column offset of the sampling grid (taken modulo the stride)
+        """
+        try:
+            frame, layout = self._grab_zone_frame(monitor_id)
+            # Strided slices: the zone average barely changes, the work drops by stride^2
+            stride = self._frame_stride(frame, sample_stride)
+            left_slices, right_slices = self._get_zone_slices(
+                layout,
+                frame.shape[0],
+                frame.shape[1],
+                stride,
+                sample_offset % stride,
             )
-            right_samples.append(np.array(bottom_right))
+            left_samples = [frame[rows, cols] for rows, cols in left_slices]
+            right_samples = [frame[rows, cols] for rows, cols in right_slices]
 
             # Calculate average colors for each zone
-            left_pixels = np.concatenate(
-                [sample.reshape(-1, 3) for sample in left_samples]
-            )
-            right_pixels = np.concatenate(
-                [sample.reshape(-1, 3) for sample in right_samples]
-            )
-
-            left_color = tuple(map(int, np.mean(left_pixels, axis=0)))
-            right_color = tuple(map(int, np.mean(right_pixels, axis=0)))
+            left_color = self._average_zone_color(left_samples)
+            right_color = self._average_zone_color(right_samples)
 
             return left_color, right_color
 
@@ -284,6 +504,56 @@ class DualLampManager:
             print(f"Warning: Screen zone capture error: {e}")
             return (50, 50, 50), (50, 50, 50)  # Fallback colors
 
+    async def _send_zone_color(
+        self, side: str, color: Tuple[int, int, int]
+    ) -> Optional[bool]:
+        """Send a zone color to one lamp with diagnostics (None if it isn't connected)."""
+        if not self.connected[side]:
+            return None
+
+        # Skip near-duplicate writes (static scenes) to free BLE bandwidth,
+        # comparing raw colors for hysteresis like the single-lamp path
+        last = self._last_sent[side]
+        if (
+            last is not None
+            and max(abs(c - l) for c, l in zip(color, last))
+            < LT22Lamp.COALESCE_THRESHOLD
+        ):
+            return True
+
+        mask = LT22Lamp.AMBIENT_COLOR_MASK
+        quantized = (color[0] & mask, color[1] & mask, color[2] & mask)
+        setter = self.set_left_color if side == "left" else self.set_right_color
+        success = await setter(*quantized)
+        if success:
+            self._last_sent[side] = color
+        else:
+            print(f"⚠️ {side.capitalize()} lamp failed to update: {quantized}")
+        return success
+
+    async def _ambilight_writer(
+        self, side: str, latest: Dict[str, Any], frame_ready: asyncio.Event
+    ):
+        """
+        Send the most recent Ambilight color to one lamp until told to stop.
+
+        Args:
+            side: "left" or "right"
+            latest: Shared slot holding the lamp's newest color, or None to stop
+            frame_ready: Set by the capture loop whenever the slot is updated
+        """
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+
+            color = latest["color"]
+            if color is None:
+                return
+
+            # One writer per lamp means at most one write in flight per lamp,
+            # and a slow lamp never holds back the other one's updates
+            latest["status"] = await self._send_zone_color(side, color)
+
     async def start_dual_ambilight(
         self,
         fps: int = 60,
@@ -310,68 +580,114 @@ class DualLampManager:
 
         # Reset color transitioner for fresh start
         self.color_transitioner.reset()
+        self._last_sent = {"left": None, "right": None}
+
+        # Single-slot "latest wins" handoff between capture and each lamp's writer
+        left_latest: Dict[str, Any] = {"color": None, "status": None}
+        right_latest: Dict[str, Any] = {"color": None, "status": None}
+        left_ready = asyncio.Event()
+        right_ready = asyncio.Event()
+
+        # Stream the monitor through DXGI Desktop Duplication when dxcam is available
+        layout = self._get_monitor_layout(monitor_id)
+        layout["dxgi_stream"] = start_dxgi_stream(layout["monitor_info"], fps)
+        # Capture strategy is decided once here, not re-evaluated every frame
+        layout["capture_fn"] = self._select_capture_fn(layout)
+
+        # One dedicated thread keeps capture state (mss/dxcam handles) on one thread
+        loop = asyncio.get_running_loop()
+        capture_executor = ThreadPoolExecutor(max_workers=1)
+        writers = [
+            asyncio.create_task(self._ambilight_writer("left", left_latest, left_ready)),
+            asyncio.create_task(
+                self._ambilight_writer("right", right_latest, right_ready)
+            ),
+        ]
+        exit_event = self._exit_watcher.start()  # Set when 'END' is pressed
 
-        try:
-            while True:
-                # Check for exit
-                if check_for_exit_key():
-                    break
-
-                # Capture and process screen zones
-                raw_left_color, raw_right_color = self._capture_screen_with_zones(
-                    monitor_id
-                )
+        # Bind hot-path lookups to locals once instead of resolving them every frame
+        capture_targets = self._capture_zone_targets
+        set_targets = self.color_transitioner.set_targets
+        update_smooth_colors = self.color_transitioner.update_smooth_colors
+        exit_requested = exit_event.is_set
+        debug_status = self.debug_status
+        self._debug_counter = 0
+        perf_counter = time.perf_counter
+        sleep = asyncio.sleep
 
-                # Apply brightness boost (more gentle approach)
-                target_left = tuple(
-                    min(255, c + brightness_boost) for c in raw_left_color
-                )
-                target_right = tuple(
-                    min(255, c + brightness_boost) for c in raw_right_color
-                )
+        next_deadline = perf_counter() + delay
 
-                # Apply saturation enhancement
-                target_left = enhance_color_saturation(*target_left, saturation_factor)
-                target_right = enhance_color_saturation(
-                    *target_right, saturation_factor
+        try:
+            while not exit_requested():
+                # Capture screen zones, then boost brightness and saturation.
+                # Runs on the capture thread so the event loop stays free for
+                # the BLE writer while the frame is grabbed and reduced
+                target_left, target_right = await loop.run_in_executor(
+                    capture_executor,
+                    capture_targets,
+                    monitor_id,
+                    brightness_boost,
+                    saturation_factor,
                 )
 
                 # Set target colors for smooth transition
-                self.color_transitioner.set_targets(target_left, target_right)
+                set_targets(target_left, target_right)
 
                 # Get smoothly transitioned colors
-                left_color, right_color = self.color_transitioner.update_smooth_colors()
-
-                # Send colors to respective lamps with detailed diagnostics
-                left_success = None
-                right_success = None
-
-                if self.connected["left"]:
-                    left_success = await self.set_left_color(*left_color)
-                    if not left_success:
-                        print(f"⚠️ Left lamp failed to update: {left_color}")
-
-                if self.connected["right"]:
-                    right_success = await self.set_right_color(*right_color)
-                    if not right_success:
-                        print(f"⚠️ Right lamp failed to update: {right_color}")
-
-                # Debug output every 60 frames (once per second at 60 FPS)
-                if hasattr(self, "_debug_counter"):
+                left_color, right_color = update_smooth_colors()
+
+                # Hand the colors to the writers; an unsent older frame is
+                # simply overwritten so only the freshest colors go out
+                left_latest["color"] = left_color
+                right_latest["color"] = right_color
+                left_ready.set()
+                right_ready.set()
+
+                # Debug output every 60 frames (once per second at 60 FPS);
+                # off by default since console writes can stall the loop
+                if debug_status:
                     self._debug_counter += 1
+                    if self._debug_counter % 60 == 0:
+                        left_success = left_latest["status"]
+                        right_success = right_latest["status"]
+                        print(
+                            f"🔍 Status: Left={left_success}, Right={right_success} | Colors: L{left_color} R{right_color}"
+                        )
+
+                # Frame rate control: sleep only for what's left of this frame
+                sleep_for = next_deadline - perf_counter()
+                if sleep_for > 0:
+                    await sleep(sleep_for)
                 else:
-                    self._debug_counter = 0
-
-                if self._debug_counter % 60 == 0:
-                    print(
-                        f"🔍 Status: Left={left_success}, Right={right_success} | Colors: L{left_color} R{right_color}"
-                    )
-
-                # Frame rate control
-                await asyncio.sleep(max(0.001, delay))
+                    # Frame overran - skip ahead instead of piling up, but
+                    # still let the BLE writer run
+                    next_deadline = perf_counter()
+                    await sleep(0)
+                next_deadline += delay
 
         except KeyboardInterrupt:
             pass
+        finally:
+            # Wait out an in-flight grab before stopping DXGI under it, but
+            # off the event loop so a slow 4K capture doesn't block it
+            await loop.run_in_executor(None, capture_executor.shutdown)
+            if layout["dxgi_stream"]:
+                stop_dxgi_streams()
+                layout["dxgi_stream"] = False
+            layout["capture_fn"] = None
+            # Geometry can change before the next session (resolution change,
+            # hot-plug), so the next one resolves its layouts afresh
+            self._zone_cache.clear()
+
+            # Also on cancellation (Ctrl+C under asyncio.run) or an error, so
+            # the key watcher and the writer tasks never outlive the session
+            await self._exit_watcher.stop()
+
+            # Stop the writers once their current writes have finished
+            left_latest["color"] = right_latest["color"] = None
+            left_ready.set()
+            right_ready.set()
+            await asyncio.gather(*writers, return_exceptions=True)
 
         print("\n🎉 Dual-lamp Ambilight stopped!")
         await self.turn_off_both()
@@ -1,20 +1,231 @@
 # bt_led_control/monitor.py
 
-from typing import List, Dict
-import tkinter as tk
+import sys
+import time
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 
+# Monitor enumeration (user32 / pywin32 / mss) is cached this long, so
+# repeated lookups are cheap but hot-plugged displays still show up
+MONITOR_CACHE_TTL = 1.0
+# (timestamp, monitor dicts, (n, 4) int32 bbox array indexed by monitor id)
+_monitor_cache: Optional[Tuple[float, List[Dict], np.ndarray]] = None
+# get_monitor_with_scaling_info results for the current enumeration
+_scaling_cache: Dict[int, Dict] = {}
 
-def get_available_monitors() -> List[Dict]:
-    """Get information about all available monitors."""
+
+def _get_monitor_cache(
+    max_age: float = MONITOR_CACHE_TTL,
+) -> Tuple[float, List[Dict], np.ndarray]:
+    """Return the monitor cache, re-enumerating once it is older than max_age seconds."""
+    global _monitor_cache
+    now = time.monotonic()
+    if _monitor_cache is None or now - _monitor_cache[0] > max_age:
+        monitors = _enumerate_monitors()
+        # The "Default Monitor" fallback has no bbox; give it a primary-sized
+        # row at the origin so the array stays numeric
+        bboxes = np.array(
+            [
+                monitor["bbox"] or (0, 0, monitor["width"], monitor["height"])
+                for monitor in monitors
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 4)
+        bboxes.setflags(write=False)  # Shared by every caller
+        _monitor_cache = (now, monitors, bboxes)
+        _scaling_cache.clear()
+    return _monitor_cache
+
+
+def get_available_monitors(max_age: float = MONITOR_CACHE_TTL) -> List[Dict]:
+    """
+    Get information about all available monitors.
+
+    Args:
+        max_age: Reuse a cached enumeration up to this many seconds old
+
+    Returns:
+        List of monitor dicts (copies, safe to modify)
+    """
+    # Copies, so callers can annotate their monitor dicts without touching the cache
+    return [dict(monitor) for monitor in _get_monitor_cache(max_age)[1]]
+
+
+def get_monitor_bboxes() -> np.ndarray:
+    """Monitor bboxes as a read-only (n, 4) int32 array, one row per monitor id."""
+    return _get_monitor_cache()[2]
+
+
+def get_monitor_at(x: int, y: int) -> Optional[int]:
+    """Return the id of the monitor containing desktop point (x, y), or None."""
+    bboxes = get_monitor_bboxes()
+    inside = (
+        (bboxes[:, 0] <= x)
+        & (x < bboxes[:, 2])
+        & (bboxes[:, 1] <= y)
+        & (y < bboxes[:, 3])
+    )
+    hits = np.flatnonzero(inside)
+    return int(hits[0]) if hits.size else None
+
+
+def invalidate_monitor_cache():
+    """Forget the cached monitor list, e.g. after a display was plugged in."""
+    global _monitor_cache
+    _monitor_cache = None
+    _scaling_cache.clear()
+
+
+def _enumerate_monitors() -> List[Dict]:
+    """Enumerate the connected monitors, preferring APIs that need no Tk window."""
+    for enumerate_fn in (
+        _enumerate_monitors_ctypes,
+        _enumerate_monitors_win32,
+        _enumerate_monitors_mss,
+    ):
+        try:
+            monitors = enumerate_fn()
+        except ImportError:
+            continue
+        except Exception as e:
+            print(f"Warning: Could not detect all monitors: {e}")
+            continue
+        if monitors:
+            return monitors
+
+    return _enumerate_primary_monitor()
+
+
+def _enumerate_monitors_ctypes() -> List[Dict]:
+    """Detailed monitor info straight from user32 via ctypes (Windows only, no pywin32)."""
+    if sys.platform != "win32":
+        return []
+
+    import ctypes
+    from ctypes import wintypes
+
+    class MONITORINFOEXW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", wintypes.RECT),
+            ("rcWork", wintypes.RECT),
+            ("dwFlags", wintypes.DWORD),
+            ("szDevice", wintypes.WCHAR * 32),
+        ]
+
+    MONITORINFOF_PRIMARY = 1
+    MonitorEnumProc = ctypes.WINFUNCTYPE(
+        wintypes.BOOL,
+        wintypes.HMONITOR,
+        wintypes.HDC,
+        ctypes.POINTER(wintypes.RECT),
+        wintypes.LPARAM,
+    )
+    user32 = ctypes.windll.user32
+
+    monitors = []
+
+    def callback(hmon, hdc, rect, lparam):
+        info = MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(MONITORINFOEXW)
+        # Pass the handle typed, so 64-bit handles aren't truncated to a C int
+        if user32.GetMonitorInfoW(wintypes.HMONITOR(hmon), ctypes.byref(info)):
+            i = len(monitors)
+            rc = info.rcMonitor
+            device_name = info.szDevice or f"Monitor {i+1}"
+            monitors.append(
+                {
+                    "id": i,
+                    "name": device_name,
+                    "width": rc.right - rc.left,
+                    "height": rc.bottom - rc.top,
+                    "bbox": (rc.left, rc.top, rc.right, rc.bottom),
+                    "primary": bool(info.dwFlags & MONITORINFOF_PRIMARY),
+                    "device": device_name,
+                }
+            )
+        return True  # Continue enumeration
+
+    user32.EnumDisplayMonitors(None, None, MonitorEnumProc(callback), 0)
+    return monitors
+
+
+def _enumerate_monitors_win32() -> List[Dict]:
+    """Detailed monitor info using the Windows API (requires pywin32)."""
+    import win32con
+    from win32api import EnumDisplayMonitors, GetMonitorInfo
+
+    monitors = []
+    for i, (hmon, hdc, rect) in enumerate(EnumDisplayMonitors()):
+        try:
+            monitor_info = GetMonitorInfo(hmon)
+            device_name = monitor_info.get("Device", f"Monitor {i+1}")
+            monitor_rect = monitor_info["Monitor"]
+            is_primary = monitor_info["Flags"] & win32con.MONITORINFOF_PRIMARY
+
+            monitors.append(
+                {
+                    "id": i,
+                    "name": device_name,
+                    "width": monitor_rect[2] - monitor_rect[0],
+                    "height": monitor_rect[3] - monitor_rect[1],
+                    "bbox": monitor_rect,
+                    "primary": bool(is_primary),
+                    "device": device_name,
+                }
+            )
+        except Exception as e:
+            print(f"Warning: Could not get info for monitor {i}: {e}")
+            continue
+
+    return monitors
+
+
+def _enumerate_monitors_mss() -> List[Dict]:
+    """Monitor geometry from mss (index 0 of sct.monitors is the virtual screen)."""
+    import mss
+
+    with mss.mss() as sct:
+        regions = sct.monitors[1:]
+
+    monitors = []
+    for i, region in enumerate(regions):
+        left, top = region["left"], region["top"]
+        width, height = region["width"], region["height"]
+        monitors.append(
+            {
+                "id": i,
+                "name": f"Monitor {i+1}",
+                "width": width,
+                "height": height,
+                "bbox": (left, top, left + width, top + height),
+                "primary": i == 0,  # mss lists the primary monitor first
+            }
+        )
+    return monitors
+
+
+def _enumerate_primary_monitor() -> List[Dict]:
+    """Primary screen size only, the last-resort fallback (GetSystemMetrics, or Tk off Windows)."""
     try:
-        # Basic fallback monitor info
-        root = tk.Tk()
-        root.withdraw()
-        width = root.winfo_screenwidth()
-        height = root.winfo_screenheight()
-        root.destroy()
-
-        monitors = [
+        if sys.platform == "win32":
+            import ctypes
+
+            user32 = ctypes.windll.user32
+            width = user32.GetSystemMetrics(0)  # SM_CXSCREEN
+            height = user32.GetSystemMetrics(1)  # SM_CYSCREEN
+        else:
+            import tkinter as tk
+
+            root = tk.Tk()
+            try:
+                root.withdraw()
+                width = root.winfo_screenwidth()
+                height = root.winfo_screenheight()
+            finally:
+                root.destroy()
+
+        return [
             {
                 "id": 0,
                 "name": "Primary Monitor",
@@ -25,45 +236,6 @@ def get_available_monitors() -> List[Dict]:
             }
         ]
 
-        # Try to get detailed monitor info using Windows API
-        try:
-            import win32api
-            import win32con
-            from win32api import EnumDisplayMonitors, GetMonitorInfo
-
-            monitors.clear()
-            monitor_handles = EnumDisplayMonitors()
-
-            for i, (hmon, hdc, rect) in enumerate(monitor_handles):
-                try:
-                    monitor_info = GetMonitorInfo(hmon)
-                    device_name = monitor_info.get("Device", f"Monitor {i+1}")
-                    monitor_rect = monitor_info["Monitor"]
-                    is_primary = monitor_info["Flags"] & win32con.MONITORINFOF_PRIMARY
-
-                    monitors.append(
-                        {
-                            "id": i,
-                            "name": device_name,
-                            "width": monitor_rect[2] - monitor_rect[0],
-                            "height": monitor_rect[3] - monitor_rect[1],
-                            "bbox": monitor_rect,
-                            "primary": bool(is_primary),
-                            "device": device_name,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Warning: Could not get info for monitor {i}: {e}")
-                    continue
-
-        except ImportError:
-            print("Info: Advanced multi-monitor support requires pywin32")
-            print("Install with: pip install pywin32")
-        except Exception as e:
-            print(f"Warning: Could not detect all monitors: {e}")
-
-        return monitors
-
     except Exception as e:
         print(f"Error detecting monitors: {e}")
         return [
@@ -78,14 +250,48 @@ def get_available_monitors() -> List[Dict]:
         ]
 
 
-def get_monitor_with_scaling_info(monitor_id: int) -> Dict:
-    """Get detailed monitor information including 4K scaling detection."""
-    monitors = get_available_monitors()
+def get_monitor_with_scaling_info(
+    monitor_id: int, max_age: float = MONITOR_CACHE_TTL
+) -> Dict:
+    """Get detailed monitor information including 4K scaling detection (cached)."""
+    monitors = get_available_monitors(max_age)
 
     if monitor_id >= len(monitors):
         return monitors[0]  # Fallback to primary
 
-    monitor = monitors[monitor_id]
+    cached = _scaling_cache.get(monitor_id)
+    if cached is not None:
+        return dict(cached)
+
+    monitor = _detect_scaling(monitors[monitor_id])
+    _scaling_cache[monitor_id] = monitor
+    return dict(monitor)
+
+
+def get_all_monitors_with_scaling_info(
+    max_age: float = MONITOR_CACHE_TTL,
+) -> Dict[int, Dict]:
+    """
+    Scaling info for every monitor from one enumeration.
+
+    Args:
+        max_age: Reuse a cached enumeration up to this many seconds old
+
+    Returns:
+        Dict mapping monitor id to its get_monitor_with_scaling_info result
+    """
+    all_info = {}
+    for monitor in _get_monitor_cache(max_age)[1]:
+        monitor_id = monitor["id"]
+        info = _scaling_cache.get(monitor_id)
+        if info is None:
+            info = _scaling_cache[monitor_id] = _detect_scaling(dict(monitor))
+        all_info[monitor_id] = dict(info)
+    return all_info
+
+
+def _detect_scaling(monitor: Dict) -> Dict:
+    """Add 4K/scaling fields to a monitor dict by querying its device context."""
 
     # Check for 4K scaling using Win32 API
     try:
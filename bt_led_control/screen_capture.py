@@ -1,63 +1,460 @@
 # bt_led_control/screen_capture.py
 
-from typing import Tuple, List, Dict, Optional
+import asyncio
+import ctypes
+import sys
+import threading
+from ctypes import wintypes
+from functools import partial
+from typing import Callable, Tuple, List, Dict, Optional, Set
 from PIL import ImageGrab, Image
 import numpy as np
-from .monitor import get_monitor_with_scaling_info
+from .monitor import get_available_monitors, get_monitor_with_scaling_info
+from .color_utils import (
+    NUMBA_AVAILABLE,
+    calculate_screen_average_color,
+    compute_edge_color,
+    smooth_color_transition,
+    sum_rgb_planes,
+)
+
+try:
+    import mss
+except ImportError:
+    # mss not available - fall back to PIL ImageGrab
+    mss = None
+
+if mss is not None and sys.platform == "win32":
+    import mss.windows
+
+    # Plain SRCCOPY blit - skips the slower layered-window (CAPTUREBLT) path
+    mss.windows.CAPTUREBLT = 0
+
+try:
+    import dxcam
+except ImportError:
+    # dxcam not available (or not Windows) - 4K capture goes through GDI
+    dxcam = None
+
+try:
+    import win32api
+    import win32con
+except ImportError:
+    # pywin32 not available - virtual desktop cropping is unavailable
+    win32api = win32con = None
+
+# mss handles (device contexts) belong to the thread that created them, so
+# each capture thread gets its own long-lived instance
+_sct_local = threading.local()
+_dxgi_cameras: Dict[int, object] = {}
+_dxgi_last_frames: Dict[int, np.ndarray] = {}
+_dxgi_failed: Set[int] = set()  # Outputs whose DXGI capture failed or mismatched
+
+
+def _get_sct():
+    """Return this thread's mss instance, created on first use and reused across frames."""
+    sct = getattr(_sct_local, "sct", None)
+    if sct is None:
+        sct = _sct_local.sct = mss.mss()
+    return sct
+
+
+def _grab_screen(
+    monitor_bbox: Optional[Tuple[int, int, int, int]] = None,
+    downsample_to: Optional[Tuple[int, int]] = None,
+):
+    """
+    Grab the primary screen or a monitor bbox.
+
+    Returns an RGB ndarray view over the mss BGRA buffer when mss is
+    installed (handles negative multi-monitor coordinates natively). Without
+    mss, Windows captures into the reusable GDI DIB section (also an ndarray
+    view, any coordinates); only other platforms get a PIL image.
+
+    downsample_to=(width, height) asks for a GDI StretchBlt capture at that
+    size on Windows (even with mss installed); elsewhere it is ignored.
+    """
+    if downsample_to and sys.platform == "win32":
+        try:
+            return _capture_monitor_win32(
+                monitor_bbox or _primary_screen_bbox(), downsample_to
+            )
+        except Exception:
+            pass  # Full-size capture below
+
+    if mss is None:
+        if sys.platform == "win32":
+            try:
+                return _capture_monitor_win32(monitor_bbox or _primary_screen_bbox())
+            except Exception:
+                pass  # Fall back to PIL below
+        return _capture_with_bbox(monitor_bbox) if monitor_bbox else ImageGrab.grab()
+
+    sct = _get_sct()
+    if monitor_bbox:
+        x1, y1, x2, y2 = monitor_bbox
+        region = {"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1}
+    else:
+        region = sct.monitors[1]  # Primary monitor, like ImageGrab.grab()
+    shot = sct.grab(region)
+
+    # BGRA -> RGB as a view, no copy
+    return np.asarray(shot)[..., 2::-1]
+
+
+def _as_rgb_array(screenshot) -> np.ndarray:
+    """
+    Return a capture as an (H, W, 3) uint8 RGB array, dropping any alpha channel.
+
+    ndarrays (mss/dxcam views) are sliced without copying; PIL images are
+    converted to RGB mode first so the array never carries a 4th channel.
+    """
+    if isinstance(screenshot, np.ndarray):
+        return screenshot[..., :3]
+    if screenshot.mode != "RGB":
+        screenshot = screenshot.convert("RGB")
+    return np.asarray(screenshot)
+
+
+def _get_dxgi_camera(output_idx: int):
+    """Return the dxcam camera for a DXGI output, created once and reused."""
+    camera = _dxgi_cameras.get(output_idx)
+    if camera is None:
+        camera = dxcam.create(output_idx=output_idx, output_color="BGRA")
+        _dxgi_cameras[output_idx] = camera
+    return camera
+
+
+def _dxgi_output_matches(camera, monitor_info: Dict) -> bool:
+    """
+    Whether a dxcam camera duplicates the monitor we enumerated.
+
+    DXGI output order isn't guaranteed to match ours, and two monitors can
+    share a resolution, so the output's desktop rectangle is compared with
+    the monitor's bbox (or, failing that, its GDI device name).
+    """
+    desc = getattr(getattr(camera, "_output", None), "desc", None)
+    if desc is None:
+        return True  # dxcam without output details; the resolution check remains
+    rect = desc.DesktopCoordinates
+    bbox = monitor_info.get("bbox")
+    desktop_rect = (rect.left, rect.top, rect.right, rect.bottom)
+    if bbox is not None and tuple(bbox) == desktop_rect:
+        return True
+    # DPI-unaware enumeration reports scaled coordinates; the device name
+    # (\\.\DISPLAYn) is the same either way
+    device = monitor_info.get("device")
+    return bool(device) and desc.DeviceName == device
+
+
+def _get_monitor_dxgi_camera(monitor_info: Dict):
+    """
+    dxcam camera for a monitor, or None once its output has been ruled out.
+
+    An output whose camera can't be created or doesn't match the monitor is
+    added to _dxgi_failed, so it is neither retried nor reported every frame.
+    """
+    output_idx = monitor_info.get("id", 0)
+    if output_idx in _dxgi_failed:
+        return None
+    try:
+        camera = _get_dxgi_camera(output_idx)
+    except Exception:
+        _dxgi_failed.add(output_idx)
+        raise
+    if not _dxgi_output_matches(camera, monitor_info):
+        _dxgi_failed.add(output_idx)
+        return None
+    return camera
+
+
+def start_dxgi_stream(monitor_info: Optional[Dict], fps: int) -> bool:
+    """
+    Start continuous DXGI capture of a monitor at the given frame rate.
 
+    While the stream runs, _capture_dxgi returns the latest frame from
+    dxcam's capture thread instead of duplicating the desktop on demand.
 
-def _capture_monitor_win32(bbox: Tuple[int, int, int, int]) -> Image.Image:
-    """Capture screen using Win32 API for multi-monitor support with negative coordinates."""
+    Returns:
+        True if the stream is running, False if dxcam is unavailable or failed
+    """
+    if dxcam is None:
+        return False
     try:
-        import win32gui
-        import win32ui
-        import win32con
-        from PIL import Image
+        camera = _get_monitor_dxgi_camera(monitor_info or {"id": 0})
+        if camera is None:
+            return False
+        if not camera.is_capturing:
+            camera.start(target_fps=fps, video_mode=True)
+        return True
+    except Exception as e:
+        print(f"DXGI stream unavailable, using standard capture: {e}")
+        return False
 
-        x1, y1, x2, y2 = bbox
-        width = x2 - x1
-        height = y2 - y1
 
-        # Get device contexts
-        hdesktop = win32gui.GetDesktopWindow()
-        hdc = win32gui.GetWindowDC(hdesktop)
-        hdcmem = win32ui.CreateDCFromHandle(hdc)
-        hdcmem2 = hdcmem.CreateCompatibleDC()
+def stop_dxgi_streams():
+    """Stop all running DXGI capture streams."""
+    for camera in _dxgi_cameras.values():
+        if camera.is_capturing:
+            camera.stop()
 
-        # Create bitmap
-        hbitmap = win32ui.CreateBitmap()
-        hbitmap.CreateCompatibleBitmap(hdcmem, width, height)
-        hdcmem2.SelectObject(hbitmap)
 
-        # Copy screen area
-        hdcmem2.BitBlt((0, 0), (width, height), hdcmem, (x1, y1), win32con.SRCCOPY)
+def _capture_dxgi(monitor_info: Dict) -> Optional[np.ndarray]:
+    """
+    Capture a monitor through the DXGI Desktop Duplication API (dxcam).
+
+    Returns an RGB ndarray view at the monitor's native resolution, or None
+    if dxcam is unavailable or the output doesn't match the monitor.
+    """
+    if dxcam is None:
+        return None
+    camera = _get_monitor_dxgi_camera(monitor_info)
+    if camera is None:
+        return None
+    output_idx = monitor_info.get("id", 0)
+
+    # A started stream already has the newest frame waiting; otherwise grab one
+    frame = camera.get_latest_frame() if camera.is_capturing else camera.grab()
+    if frame is None:
+        # No new frame since the last grab - the screen hasn't changed
+        frame = _dxgi_last_frames.get(output_idx)
+        if frame is None:
+            return None
+    else:
+        _dxgi_last_frames[output_idx] = frame
+
+    # Even on the matching output, only trust a frame with the monitor's
+    # actual resolution (e.g. after a mode change)
+    expected = monitor_info.get("actual_resolution")
+    if expected and (frame.shape[1], frame.shape[0]) != tuple(expected):
+        _dxgi_failed.add(output_idx)  # Don't duplicate this output again
+        return None
+
+    # BGRA -> RGB as a view, no copy
+    return frame[..., 2::-1]
 
-        # Convert to PIL Image
-        bmpinfo = hbitmap.GetInfo()
-        bmpstr = hbitmap.GetBitmapBits(True)
-        img = Image.frombuffer(
-            "RGB",
-            (bmpinfo["bmWidth"], bmpinfo["bmHeight"]),
-            bmpstr,
-            "raw",
-            "BGRX",
-            0,
-            1,
-        )
+
+def _capture_4k_fast(monitor_info: Dict):
+    """Capture a 4K monitor via DXGI when possible, otherwise via the GDI method."""
+    try:
+        frame = _capture_dxgi(monitor_info)
+        if frame is not None:
+            return frame
+    except Exception as e:
+        print(f"DXGI capture failed, using GDI: {e}")
+    return _capture_4k_scaled_monitor(monitor_info)
+
+
+_gdi = None
+
+
+def _load_gdi():
+    """Private user32/gdi32 handles with 64-bit-safe prototypes (Windows only)."""
+    global _gdi
+    if _gdi is None:
+        user32 = ctypes.WinDLL("user32")
+        gdi32 = ctypes.WinDLL("gdi32")
+        user32.GetDesktopWindow.restype = wintypes.HWND
+        user32.GetWindowDC.argtypes = [wintypes.HWND]
+        user32.GetWindowDC.restype = wintypes.HDC
+        user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+        gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        gdi32.CreateDIBSection.argtypes = [
+            wintypes.HDC,
+            ctypes.c_void_p,
+            wintypes.UINT,
+            ctypes.POINTER(ctypes.c_void_p),
+            wintypes.HANDLE,
+            wintypes.DWORD,
+        ]
+        gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        gdi32.DeleteDC.argtypes = [wintypes.HDC]
+        gdi32.BitBlt.argtypes = [wintypes.HDC] + [ctypes.c_int] * 4 + [
+            wintypes.HDC,
+            ctypes.c_int,
+            ctypes.c_int,
+            wintypes.DWORD,
+        ]
+        gdi32.StretchBlt.argtypes = (
+            [wintypes.HDC] + [ctypes.c_int] * 4 + [wintypes.HDC] + [ctypes.c_int] * 4
+        ) + [wintypes.DWORD]
+        gdi32.SetStretchBltMode.argtypes = [wintypes.HDC, ctypes.c_int]
+        gdi32.SetBrushOrgEx.argtypes = [
+            wintypes.HDC,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+        ]
+        _gdi = (user32, gdi32)
+    return _gdi
+
+
+class _Win32CaptureCache:
+    """Desktop DCs and a DIB section reused across frames (resized on demand)."""
+
+    SRCCOPY = 0x00CC0020
+    HALFTONE = 4  # StretchBlt mode that averages source pixels into each target pixel
+
+    def __init__(self):
+        self.hdesktop = None
+        self.hdc = None
+        self.hdcmem = None
+        self.hbitmap = None
+        self.size: Optional[Tuple[int, int]] = None
+        self.frame: Optional[np.ndarray] = None  # (H, W, 4) BGRX view of the DIB
+
+    def ensure(self, width: int, height: int):
+        """Create the device contexts once and a DIB section matching width x height."""
+        user32, gdi32 = _load_gdi()
+        if self.hdc is None:
+            # Get device contexts
+            self.hdesktop = user32.GetDesktopWindow()
+            self.hdc = user32.GetWindowDC(self.hdesktop)
+            self.hdcmem = gdi32.CreateCompatibleDC(self.hdc)
+            # Only affects StretchBlt (downsampled captures); BitBlt ignores it
+            gdi32.SetStretchBltMode(self.hdcmem, self.HALFTONE)
+            gdi32.SetBrushOrgEx(self.hdcmem, 0, 0, None)
+
+        if self.size != (width, height):
+
+            class BITMAPINFOHEADER(ctypes.Structure):
+                _fields_ = [
+                    ("biSize", wintypes.DWORD),
+                    ("biWidth", wintypes.LONG),
+                    ("biHeight", wintypes.LONG),
+                    ("biPlanes", wintypes.WORD),
+                    ("biBitCount", wintypes.WORD),
+                    ("biCompression", wintypes.DWORD),
+                    ("biSizeImage", wintypes.DWORD),
+                    ("biXPelsPerMeter", wintypes.LONG),
+                    ("biYPelsPerMeter", wintypes.LONG),
+                    ("biClrUsed", wintypes.DWORD),
+                    ("biClrImportant", wintypes.DWORD),
+                ]
+
+            # 32bpp BI_RGB, negative height = top-down rows like a screenshot
+            header = BITMAPINFOHEADER(
+                ctypes.sizeof(BITMAPINFOHEADER), width, -height, 1, 32, 0
+            )
+            bits = ctypes.c_void_p()
+            hbitmap = gdi32.CreateDIBSection(
+                self.hdc, ctypes.byref(header), 0, ctypes.byref(bits), None, 0
+            )
+            if not hbitmap:
+                raise ctypes.WinError()
+
+            # Select the new DIB, then free the old one once it is no longer selected
+            gdi32.SelectObject(self.hdcmem, hbitmap)
+            self.frame = None
+            if self.hbitmap:
+                gdi32.DeleteObject(self.hbitmap)
+            self.hbitmap = hbitmap
+            self.size = (width, height)
+
+            # BitBlt writes straight into this memory - no GetBitmapBits copy
+            buffer = (ctypes.c_uint8 * (width * height * 4)).from_address(bits.value)
+            self.frame = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+
+    def release(self):
+        """Delete the cached GDI objects (recreated on the next ensure())."""
+        if self.hdc is None:
+            return
+        user32, gdi32 = _load_gdi()
 
         # Cleanup
-        hdcmem2.DeleteDC()
-        hdcmem.DeleteDC()
-        win32gui.ReleaseDC(hdesktop, hdc)
-        win32gui.DeleteObject(hbitmap.GetHandle())
+        self.frame = None
+        gdi32.DeleteDC(self.hdcmem)
+        user32.ReleaseDC(self.hdesktop, self.hdc)
+        if self.hbitmap:
+            gdi32.DeleteObject(self.hbitmap)
+        self.hdesktop = self.hdc = self.hdcmem = self.hbitmap = None
+        self.size = None
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
 
-        return img
 
-    except ImportError:
-        raise ImportError(
-            "Win32 capture requires pywin32. Install with: pip install pywin32"
-        )
+# GDI handles are used by one capture thread at a time, like the mss instances
+_win32_local = threading.local()
+
+
+def _primary_screen_bbox() -> Tuple[int, int, int, int]:
+    """Bounding box of the primary monitor from GetSystemMetrics (Windows only)."""
+    user32, _ = _load_gdi()
+    return (0, 0, user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+
+
+def _capture_monitor_win32(
+    bbox: Tuple[int, int, int, int],
+    downsample_to: Optional[Tuple[int, int]] = None,
+) -> np.ndarray:
+    """
+    Capture screen using Win32 API for multi-monitor support with negative coordinates.
+
+    Returns an RGB view over a DIB section that is reused across frames, so it
+    is only valid until the next capture on the same thread. With
+    downsample_to=(width, height), GDI halftone-scales the region into a
+    small DIB instead, so only a few KB are read back per frame - enough
+    for average/edge colors, not for callers that need the full image.
+    """
+    if sys.platform != "win32":
+        raise Exception("Win32 screen capture is only available on Windows")
+
+    cache = getattr(_win32_local, "cache", None)
+    if cache is None:
+        cache = _win32_local.cache = _Win32CaptureCache()
+
+    try:
+        x1, y1, x2, y2 = bbox
+        width = x2 - x1
+        height = y2 - y1
+
+        user32, gdi32 = _load_gdi()
+        if downsample_to:
+            # Halftone-average the screen area into a small DIB
+            out_width, out_height = downsample_to
+            cache.ensure(out_width, out_height)
+            if not gdi32.StretchBlt(
+                cache.hdcmem,
+                0,
+                0,
+                out_width,
+                out_height,
+                cache.hdc,
+                x1,
+                y1,
+                width,
+                height,
+                cache.SRCCOPY,
+            ):
+                raise OSError("StretchBlt failed")
+        else:
+            # Reuse the DCs and DIB section from the previous frame
+            cache.ensure(width, height)
+
+            # Copy screen area straight into the DIB memory
+            if not gdi32.BitBlt(
+                cache.hdcmem, 0, 0, width, height, cache.hdc, x1, y1, cache.SRCCOPY
+            ):
+                raise OSError("BitBlt failed")
+        gdi32.GdiFlush()
+
+        # BGRX -> RGB as a view, no copy
+        return cache.frame[..., 2::-1]
+
     except Exception as e:
+        # Drop the handles (e.g. after a desktop switch) so the next frame rebuilds them
+        try:
+            cache.release()
+        except Exception:
+            pass
         raise Exception(f"Win32 screen capture failed: {e}")
 
 
@@ -125,9 +522,8 @@ def _capture_with_bbox(monitor_bbox: Tuple[int, int, int, int]) -> Image.Image:
         screenshot = ImageGrab.grab(all_screens=True)
 
         # Get virtual desktop coordinates
-        import win32api
-        import win32con
-
+        if win32api is None:
+            raise ImportError("pywin32 is required for negative monitor coordinates")
         virt_left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
         virt_top = win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN)
 
@@ -150,8 +546,8 @@ def _capture_with_bbox(monitor_bbox: Tuple[int, int, int, int]) -> Image.Image:
 def _capture_4k_scaled_monitor(monitor_info: Dict) -> Image.Image:
     """Capture a scaled 4K monitor at full resolution using virtual desktop method."""
     try:
-        import win32api
-        import win32con
+        if win32api is None:
+            raise ImportError("pywin32 is required for 4K scaled capture")
 
         # Get virtual desktop coordinates
         virt_left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
@@ -205,142 +601,177 @@ def _capture_4k_scaled_monitor(monitor_info: Dict) -> Image.Image:
         return _capture_with_bbox(monitor_info["windows_rect"])
 
 
+def _grab_monitor(
+    monitor_bbox: Optional[Tuple[int, int, int, int]],
+    monitor_info: Optional[Dict],
+    downsample_to: Optional[Tuple[int, int]] = None,
+):
+    """
+    Grab one monitor, preferring DXGI Desktop Duplication over GDI/mss.
+
+    DXGI frames come straight from the GPU's desktop image without a GDI
+    round trip. An output that fails or doesn't match the monitor is
+    disabled, and the 4K GDI or bbox capture is used instead.
+    """
+    if monitor_info is None:
+        return _grab_screen(monitor_bbox, downsample_to)
+
+    try:
+        frame = _capture_dxgi(monitor_info)
+        if frame is not None:
+            return frame
+    except Exception as e:
+        print(f"DXGI capture failed, using GDI: {e}")
+        _dxgi_failed.add(monitor_info.get("id", 0))
+
+    if monitor_info.get("is_4k") and monitor_info.get("is_scaled"):
+        try:
+            # Scaled 4K displays need the DPI-aware capture
+            return _capture_4k_scaled_monitor(monitor_info)
+        except Exception as e:
+            print(f"4K scaled capture failed, falling back: {e}")
+    return _grab_screen(monitor_bbox, downsample_to)
+
+
+def _resolve_capture_fn(
+    monitor_bbox: Optional[Tuple[int, int, int, int]],
+    monitor_info: Optional[Dict],
+    downsample_to: Optional[Tuple[int, int]] = None,
+) -> Callable[[], object]:
+    """
+    Pick the capture backend for a monitor once, as a no-argument callable.
+
+    Continuous capture calls the result every frame instead of re-running
+    the 4K/DXGI checks in get_screen_average_color/get_screen_edge_color.
+    """
+    if monitor_info is not None:
+        if dxcam is not None:
+            # DXGI first; _grab_monitor keeps the GDI fallbacks for this output
+            return partial(_grab_monitor, monitor_bbox, monitor_info, downsample_to)
+        if monitor_info.get("is_4k") and monitor_info.get("is_scaled"):
+            return partial(_capture_4k_scaled_monitor, monitor_info)
+    return partial(_grab_screen, monitor_bbox, downsample_to)
+
+
 def get_screen_average_color(
     monitor_bbox: Optional[Tuple[int, int, int, int]] = None,
     monitor_id: Optional[int] = None,
+    monitor_info: Optional[Dict] = None,
+    downsample_to: Optional[Tuple[int, int]] = None,
 ) -> Tuple[int, int, int]:
-    """Capture screen and return average RGB color across entire screen or specified monitor."""
+    """
+    Capture screen and return average RGB color across entire screen or specified monitor.
+
+    Pass monitor_info (from get_monitor_with_scaling_info) to skip the monitor
+    lookup when calling this every frame. With monitor_id set, the DXGI
+    Desktop Duplication backend (dxcam) is preferred when it is installed.
+    downsample_to=(width, height), e.g. (64, 36), lets the GDI capture
+    shrink the frame before it is read back.
+    """
     try:
-        # If monitor_id is provided, check if it's a scaled 4K display
         if monitor_id is not None:
-            monitor_info = get_monitor_with_scaling_info(monitor_id)
-            if monitor_info and monitor_info["is_4k"] and monitor_info["is_scaled"]:
-                try:
-                    # Use 4K scaled capture for scaled 4K displays
-                    screenshot = _capture_4k_scaled_monitor(monitor_info)
-                except Exception as e:
-                    print(f"4K scaled capture failed, falling back: {e}")
-                    # Fall back to bbox method
-                    if monitor_bbox:
-                        screenshot = _capture_with_bbox(monitor_bbox)
-                    else:
-                        screenshot = ImageGrab.grab()
-            else:
-                # Use bbox method for non-4K or non-scaled displays
-                if monitor_bbox:
-                    screenshot = _capture_with_bbox(monitor_bbox)
-                else:
-                    screenshot = ImageGrab.grab()
+            if monitor_info is None:
+                monitor_info = get_monitor_with_scaling_info(monitor_id)
+            # DXGI Desktop Duplication first, then the 4K/bbox capture paths
+            screenshot = _grab_monitor(monitor_bbox, monitor_info, downsample_to)
         else:
             # Legacy behavior - use bbox if provided
-            if monitor_bbox:
-                screenshot = _capture_with_bbox(monitor_bbox)
-            else:
-                screenshot = ImageGrab.grab()
+            screenshot = _grab_screen(monitor_bbox, downsample_to)
 
-        # Use moderate resize for speed while keeping color accuracy
-        screenshot = screenshot.resize((640, 360))  # Smaller but not too small
-        img_array = np.array(screenshot)
-        avg_color = np.mean(img_array, axis=(0, 1))
-        return tuple(map(int, avg_color))
+        return calculate_screen_average_color(screenshot)
 
     except Exception as e:
+        # Don't re-capture here: that doubles the cost of every transient
+        # failure (e.g. a display mode change); the next frame retries
         print(f"Warning: Screen capture error: {e}")
-        # Fallback to basic capture
-        try:
-            screenshot = ImageGrab.grab()
-            screenshot = screenshot.resize((640, 360))
-            img_array = np.array(screenshot)
-            avg_color = np.mean(img_array, axis=(0, 1))
-            return tuple(map(int, avg_color))
-        except:
-            return (0, 0, 0)
+        return (0, 0, 0)
+
+
+def _average_edge_color(
+    img_array: np.ndarray, edge_width: int, stride: int = 1, offset: int = 0
+) -> Tuple[int, int, int]:
+    """
+    Average the four edge strips with integer sums per view - no concatenation.
+
+    Every stride-th pixel is sampled on each axis; offset shifts the columns
+    of the sampling grid so a rotating offset doesn't alias on vertical lines.
+    """
+    stride = max(1, stride)
+    if NUMBA_AVAILABLE:
+        # Compiled strided sums over the strips, no temporaries
+        return compute_edge_color(img_array, edge_width, stride, offset % stride)
+
+    cols = slice(offset % stride, None, stride)
+    top = img_array[:edge_width:stride, :, :3]
+    bottom = img_array[-edge_width::stride, :, :3]
+    left = img_array[::stride, :edge_width, :3]
+    right = img_array[::stride, -edge_width:, :3]
+    views = (
+        top[:, cols],  # Top edge - larger sample
+        bottom[:, cols],  # Bottom edge - larger sample
+        left[:, cols],  # Left edge - full height
+        right[:, cols],  # Right edge - full height
+    )
+    sum_r = sum_g = sum_b = count = 0
+    for view in views:
+        # Per-plane integer sums: no float upcast, no overflow at 4K
+        r, g, b = sum_rgb_planes(view)
+        sum_r += r
+        sum_g += g
+        sum_b += b
+        count += view.shape[0] * view.shape[1]
+
+    count = max(1, count)
+    return sum_r // count, sum_g // count, sum_b // count
 
 
 def get_screen_edge_color(
     edge_width: int = 50,
     monitor_bbox: Optional[Tuple[int, int, int, int]] = None,
     monitor_id: Optional[int] = None,
+    monitor_info: Optional[Dict] = None,
+    sample_stride: int = 4,
+    sample_offset: int = 0,
+    downsample_to: Optional[Tuple[int, int]] = None,
 ) -> Tuple[int, int, int]:
-    """Capture screen and return average color from edges (Ambilight-style)."""
+    """
+    Capture screen and return average color from edges (Ambilight-style).
+
+    Args:
+        edge_width: Width of the sampled border in pixels
+        monitor_bbox: Monitor bounding box (None = primary screen)
+        monitor_id: Monitor index, used for 4K-aware capture
+        monitor_info: Cached result of get_monitor_with_scaling_info
+        sample_stride: Average every Nth pixel on each axis (1 = every pixel)
+        sample_offset: Column offset of the sampling grid, rotated per frame
+        downsample_to: (width, height) for a halftone-scaled GDI capture;
+            edge_width is scaled to match and every pixel is sampled
+    """
     try:
-        # Use 4K-aware capture if monitor_id is provided and it's a scaled 4K display
         if monitor_id is not None:
-            monitor_info = get_monitor_with_scaling_info(monitor_id)
-            if monitor_info and monitor_info["is_4k"] and monitor_info["is_scaled"]:
-                try:
-                    screenshot = _capture_4k_scaled_monitor(monitor_info)
-                except Exception as e:
-                    print(f"4K edge capture failed, falling back: {e}")
-                    screenshot = (
-                        _capture_with_bbox(monitor_bbox)
-                        if monitor_bbox
-                        else ImageGrab.grab()
-                    )
-            else:
-                screenshot = (
-                    _capture_with_bbox(monitor_bbox)
-                    if monitor_bbox
-                    else ImageGrab.grab()
-                )
-        elif monitor_bbox and (monitor_bbox[0] < 0 or monitor_bbox[1] < 0):
-            # Use Win32 for monitors with negative coordinates
-            screenshot = _capture_monitor_win32(monitor_bbox)
-        elif monitor_bbox:
-            screenshot = ImageGrab.grab(bbox=monitor_bbox)
+            if monitor_info is None:
+                monitor_info = get_monitor_with_scaling_info(monitor_id)
+            # DXGI Desktop Duplication first, then the 4K/bbox capture paths
+            screenshot = _grab_monitor(monitor_bbox, monitor_info, downsample_to)
         else:
-            screenshot = ImageGrab.grab()
-
-        img_array = np.array(screenshot)
-        height, width = img_array.shape[:2]
-
-        # Sample larger edge areas for better color detection
-        edge_pixels = []
-
-        # Top edge - larger sample
-        top_edge = img_array[:edge_width, :]
-        edge_pixels.append(top_edge)
-
-        # Bottom edge - larger sample
-        bottom_edge = img_array[-edge_width:, :]
-        edge_pixels.append(bottom_edge)
+            # Persistent mss context or the GDI DIB section - handles
+            # negative multi-monitor coordinates either way
+            screenshot = _grab_screen(monitor_bbox, downsample_to)
 
-        # Left edge - full height for better sampling
-        left_edge = img_array[:, :edge_width]
-        edge_pixels.append(left_edge)
+        img_array = _as_rgb_array(screenshot)
+        if downsample_to and img_array.shape[:2] == downsample_to[::-1]:
+            # Halftone already averaged each pixel's block - scale the
+            # border to the small frame and sample all of it
+            x1, _, x2, _ = monitor_bbox or _primary_screen_bbox()
+            edge_width = max(1, round(edge_width * downsample_to[0] / (x2 - x1)))
+            sample_stride, sample_offset = 1, 0
 
-        # Right edge - full height for better sampling
-        right_edge = img_array[:, -edge_width:]
-        edge_pixels.append(right_edge)
-
-        all_edge_pixels = np.concatenate(
-            [pixels.reshape(-1, 3) for pixels in edge_pixels]
-        )
-        avg_color = np.mean(all_edge_pixels, axis=0)
-        return tuple(map(int, avg_color))
+        return _average_edge_color(img_array, edge_width, sample_stride, sample_offset)
 
     except Exception as e:
+        # No re-capture on failure - the next frame retries
         print(f"Warning: Screen edge capture error: {e}")
-        # Fallback to basic capture
-        screenshot = ImageGrab.grab()
-        img_array = np.array(screenshot)
-        height, width = img_array.shape[:2]
-
-        edge_pixels = []
-        top_edge = img_array[:edge_width, :]
-        edge_pixels.append(top_edge)
-        bottom_edge = img_array[-edge_width:, :]
-        edge_pixels.append(bottom_edge)
-        left_edge = img_array[:, :edge_width]
-        edge_pixels.append(left_edge)
-        right_edge = img_array[:, -edge_width:]
-        edge_pixels.append(right_edge)
-
-        all_edge_pixels = np.concatenate(
-            [pixels.reshape(-1, 3) for pixels in edge_pixels]
-        )
-        avg_color = np.mean(all_edge_pixels, axis=0)
-        return tuple(map(int, avg_color))
+        return (0, 0, 0)
 
 
 class ScreenColorCapture:
@@ -355,9 +786,22 @@ class ScreenColorCapture:
         self.edge_width = edge_width
         self.smoothing_factor = smoothing_factor
         self.current_color = (0, 0, 0)
+        # Float smoothing state; current_color is its rounded value
+        self._smoothed = np.zeros(3, dtype=np.float32)
         self.use_edge_sampling = True
         self.monitor_id = monitor_id
         self.monitor_bbox = None
+        self.monitor_info = None  # Scaled geometry, resolved once per monitor
+        self.sample_stride = 4  # Edge sampling: every 4th pixel on each axis
+        self._sample_phase = 0  # Rotating column offset of the sampling grid
+        # Full-screen average mode reads back a halftone-scaled GDI frame
+        self.downsample_to: Optional[Tuple[int, int]] = (64, 36)
+        # Background capture (start/stop): newest raw color, replaced per frame
+        self._latest: Optional[Tuple[int, int, int]] = None
+        self._frame_ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._capture_fn = _resolve_capture_fn(None, None)
 
         # Get monitor info if specific monitor requested
         if monitor_id is not None:
@@ -366,13 +810,13 @@ class ScreenColorCapture:
     def set_monitor(self, monitor_id: int) -> bool:
         """Set which monitor to capture from."""
         try:
-            from .monitor import get_available_monitors
-
             monitors = get_available_monitors()
             if 0 <= monitor_id < len(monitors):
                 self.monitor_id = monitor_id
                 selected_monitor = monitors[monitor_id]
                 self.monitor_bbox = selected_monitor.get("bbox")
+                self.monitor_info = get_monitor_with_scaling_info(monitor_id)
+                self._update_capture_fn()
                 print(
                     f"✅ Monitor set to: {selected_monitor['name']} ({selected_monitor['width']}x{selected_monitor['height']})"
                 )
@@ -389,33 +833,120 @@ class ScreenColorCapture:
     def get_monitor_info(self) -> Optional[Dict]:
         """Get information about the currently selected monitor."""
         if self.monitor_id is not None:
-            from .monitor import get_available_monitors
-
             monitors = get_available_monitors()
             if 0 <= self.monitor_id < len(monitors):
                 return monitors[self.monitor_id]
         return None
 
+    def _update_capture_fn(self):
+        """Re-resolve the capture backend after the monitor or sampling mode changes."""
+        # Edge sampling needs the real border pixels, so only averages downsample
+        downsample_to = None if self.use_edge_sampling else self.downsample_to
+        self._capture_fn = _resolve_capture_fn(
+            self.monitor_bbox, self.monitor_info, downsample_to
+        )
+
+    def _capture_raw_color(self) -> Tuple[int, int, int]:
+        """Capture one frame and reduce it to an unsmoothed color."""
+        screenshot = self._capture_fn()
+        if self.use_edge_sampling:
+            self._sample_phase = (self._sample_phase + 1) % self.sample_stride
+            return _average_edge_color(
+                _as_rgb_array(screenshot),
+                self.edge_width,
+                self.sample_stride,
+                self._sample_phase,
+            )
+        return calculate_screen_average_color(screenshot)
+
+    def _capture_loop(self, interval: float):
+        """Capture thread body: keep replacing the latest color until stopped."""
+        failing = False
+        while not self._stop_event.is_set():
+            try:
+                self._latest = self._capture_raw_color()  # Tuple swap is atomic
+                self._frame_ready.set()
+                failing = False
+            except Exception as e:
+                if not failing:  # Warn once per run of failures, not every frame
+                    print(f"Warning: Screen capture error: {e}")
+                failing = True
+                self._stop_event.wait(0.1)  # Back off instead of spinning
+                continue
+            if interval:
+                self._stop_event.wait(interval)
+
+    def start(self, fps: Optional[int] = None):
+        """
+        Capture continuously on a daemon thread so capture overlaps the LED writes.
+
+        While running, get_next_color only smooths the newest captured color
+        instead of capturing itself, and wait_next_frame waits for a new one.
+
+        Args:
+            fps: Capture rate limit (None = as fast as capture allows)
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._frame_ready.clear()
+        self._latest = None
+        self._thread = threading.Thread(
+            target=self._capture_loop,
+            args=(1.0 / fps if fps else 0.0,),
+            name="screen-capture",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background capture thread started by start()."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._frame_ready.set()  # Release anyone still in wait_next_frame
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    async def wait_next_frame(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until the capture thread has a frame get_next_color hasn't read yet.
+
+        The wait runs in an executor so it never blocks the event loop.
+
+        Returns:
+            False if no new frame arrived within timeout
+        """
+        if self._thread is None:
+            return True  # get_next_color captures a fresh frame itself
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._frame_ready.wait, timeout)
+
     def get_next_color(self) -> Tuple[int, int, int]:
         """Get the next smoothed color from screen capture."""
         try:
-            from .color_utils import smooth_color_transition
-
-            if self.use_edge_sampling:
-                raw_color = get_screen_edge_color(
-                    self.edge_width, self.monitor_bbox, self.monitor_id
-                )
+            if self._thread is not None:
+                # Latest frame from the capture thread. Clear before reading so
+                # a frame landing after this read wakes the next wait_next_frame
+                self._frame_ready.clear()
+                raw_color = self._latest
+                if raw_color is None:
+                    return self.current_color  # No frame yet; never block here
             else:
-                # Pass monitor_id for better 4K support
-                raw_color = get_screen_average_color(self.monitor_bbox, self.monitor_id)
+                raw_color = self._capture_raw_color()
 
             # If smoothing is 0 (instant), return raw color directly
             if self.smoothing_factor == 0.0:
+                self._smoothed[:] = raw_color
                 self.current_color = raw_color
             else:
-                self.current_color = smooth_color_transition(
-                    self.current_color, raw_color, self.smoothing_factor
+                # Smooth in float so small steps aren't truncated away, and
+                # only round to an int tuple at the boundary
+                self._smoothed = smooth_color_transition(
+                    self._smoothed, np.asarray(raw_color), self.smoothing_factor
                 )
+                r, g, b = np.rint(self._smoothed).astype(int).tolist()
+                self.current_color = (r, g, b)
 
             return self.current_color
 
@@ -426,6 +957,7 @@ class ScreenColorCapture:
     def set_edge_sampling(self, enabled: bool):
         """Enable or disable edge-based sampling."""
         self.use_edge_sampling = enabled
+        self._update_capture_fn()
 
     def set_smoothing(self, factor: float):
         """Set the smoothing factor (0.0 = very smooth, 1.0 = instant)."""
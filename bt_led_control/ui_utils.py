@@ -1,57 +1,88 @@
 # bt_led_control/ui_utils.py
 
 from typing import List, Dict
-from .monitor import get_available_monitors, get_monitor_with_scaling_info
-
-
-def display_available_monitors() -> List[Dict]:
-    """Display all available monitors for user selection."""
-    monitors = get_available_monitors()
-
-    print("\n🖥️  Available Monitors:")
-    print("=" * 40)
-
+from .monitor import (
+    get_all_monitors_with_scaling_info,
+    get_available_monitors,
+    invalidate_monitor_cache,
+)
+
+# Monitor topology doesn't change between menu visits, so the menus reuse an
+# enumeration (and its scaling info) for this long unless asked to rescan
+UI_MONITOR_CACHE_TTL = 5.0
+
+
+def display_available_monitors(refresh: bool = False) -> List[Dict]:
+    """Display all available monitors for user selection (refresh=True forces a rescan)."""
+    if refresh:
+        invalidate_monitor_cache()
+    monitors = get_available_monitors(max_age=UI_MONITOR_CACHE_TTL)
+    # Scaling info for all monitors in one pass over the same enumeration
+    all_info = get_all_monitors_with_scaling_info(max_age=UI_MONITOR_CACHE_TTL)
+
+    lines = ["\n🖥️  Available Monitors:", "=" * 40]
     for monitor in monitors:
         primary_str = " (PRIMARY)" if monitor.get("primary", False) else ""
+        lines.append(f"  {monitor['id']}: {monitor['name']}{primary_str}")
 
-        # Get detailed info for 4K detection
-        detailed_info = get_monitor_with_scaling_info(monitor["id"])
-
-        print(f"  {monitor['id']}: {monitor['name']}{primary_str}")
+        # Detailed info for 4K detection, each field looked up once
+        detailed_info = all_info[monitor["id"]]
+        is_4k = detailed_info.get("is_4k")
+        width, height = monitor["width"], monitor["height"]
 
         # Show resolution with 4K info if available
-        if detailed_info.get("is_4k") and detailed_info.get("is_scaled"):
-            virtual_res = detailed_info["virtual_resolution"]
-            actual_res = detailed_info["actual_resolution"]
-            scaling_percent = int(actual_res[0] / virtual_res[0] * 100)
-            print(
-                f"      Resolution: {virtual_res[0]}x{virtual_res[1]} (4K @ {scaling_percent}% scaling)"
+        if is_4k and detailed_info.get("is_scaled"):
+            virt_w, virt_h = detailed_info["virtual_resolution"]
+            actual_w, actual_h = detailed_info["actual_resolution"]
+            scaling_percent = int(actual_w / virt_w * 100)
+            lines.append(
+                f"      Resolution: {virt_w}x{virt_h} (4K @ {scaling_percent}% scaling)"
             )
-            print(f"      Actual: {actual_res[0]}x{actual_res[1]}")
-        elif detailed_info.get("is_4k"):
-            print(f"      Resolution: {monitor['width']}x{monitor['height']} (4K)")
+            lines.append(f"      Actual: {actual_w}x{actual_h}")
+        elif is_4k:
+            lines.append(f"      Resolution: {width}x{height} (4K)")
         else:
-            print(f"      Resolution: {monitor['width']}x{monitor['height']}")
+            lines.append(f"      Resolution: {width}x{height}")
 
-        if monitor.get("bbox"):
-            bbox = monitor["bbox"]
-            print(f"      Position: ({bbox[0]}, {bbox[1]}) to ({bbox[2]}, {bbox[3]})")
-        print()
+        bbox = monitor.get("bbox")
+        if bbox:
+            x1, y1, x2, y2 = bbox
+            lines.append(f"      Position: ({x1}, {y1}) to ({x2}, {y2})")
+        lines.append("")
 
+    print("\n".join(lines))
     return monitors
 
 
-def choose_monitor_interactive() -> int:
-    """Interactive monitor selection."""
-    monitors = display_available_monitors()
+def _only_one_monitor() -> bool:
+    """True (after telling the user) when there is no monitor to choose between."""
+    if len(get_available_monitors(max_age=UI_MONITOR_CACHE_TTL)) != 1:
+        return False
+    print("Only one monitor detected. Using it automatically.")
+    return True
 
-    if len(monitors) == 1:
-        print("Only one monitor detected. Using it automatically.")
+
+def choose_monitor_interactive(refresh: bool = False) -> int:
+    """Interactive monitor selection ('r' rescans the connected monitors)."""
+    if refresh:
+        invalidate_monitor_cache()
+    # Count first, so a single-monitor setup skips the scaling-info lookups
+    # and the listing entirely
+    if _only_one_monitor():
         return 0
+    monitors = display_available_monitors()
 
     while True:
         try:
-            choice = input(f"Choose monitor (0-{len(monitors)-1}): ").strip()
+            choice = input(
+                f"Choose monitor (0-{len(monitors)-1}, r = rescan): "
+            ).strip()
+            if choice.lower() == "r":
+                invalidate_monitor_cache()
+                if _only_one_monitor():
+                    return 0
+                monitors = display_available_monitors()
+                continue
             monitor_id = int(choice)
             if 0 <= monitor_id < len(monitors):
                 return monitor_id
@@ -64,6 +95,6 @@ def choose_monitor_interactive() -> int:
             return 0
 
 
-def list_monitors():
+def list_monitors(refresh: bool = False):
     """List all available monitors."""
-    display_available_monitors()
+    display_available_monitors(refresh)
@@ -1,16 +1,129 @@
 # bt_led_control/utils.py
 
+import asyncio
+import ctypes
+import threading
+import time
+from typing import Optional
+
 import msvcrt
 
+VK_END = 0x23
+
+# user32.GetAsyncKeyState, or False when it can't be loaded
+_get_async_key_state = None
+
+
+def _get_key_state_fn():
+    """Bind user32.GetAsyncKeyState once, lazily."""
+    global _get_async_key_state
+    if _get_async_key_state is None:
+        try:
+            user32 = ctypes.WinDLL("user32")
+            user32.GetAsyncKeyState.argtypes = [ctypes.c_int]
+            user32.GetAsyncKeyState.restype = ctypes.c_short
+            _get_async_key_state = user32.GetAsyncKeyState
+        except (AttributeError, OSError):
+            _get_async_key_state = False
+    return _get_async_key_state
+
 
 def check_for_exit_key() -> bool:
     """Check if user pressed End key to exit ambient mode."""
-    if msvcrt.kbhit():
-        key = msvcrt.getch()
-        # Handle special keys (2-byte sequences)
-        if ord(key) == 224:  # Special key prefix
-            key2 = msvcrt.getch()
-            # Check for End key (79)
-            return ord(key2) == 79
+    get_async_key_state = _get_key_state_fn()
+    if get_async_key_state:
+        # One call reading the key's current state, without touching the
+        # console input queue (ExitKeyWatcher.stop drains it afterwards)
+        return (get_async_key_state(VK_END) & 0x8000) != 0
+
+    if not msvcrt.kbhit():
         return False
-    return False
+    # Special keys arrive as a 2-byte sequence: 0xE0 prefix, then b"O" for End
+    if msvcrt.getch() != b"\xe0":
+        return False
+    return msvcrt.getch() == b"O"
+
+
+async def run_with_timeout(coro, seconds: float):
+    """
+    Await coro, cancelling it once `seconds` have passed.
+
+    A call_later timer on the task instead of asyncio.wait_for, which wraps
+    the awaitable in an extra future before Python 3.12.
+
+    Raises:
+        asyncio.TimeoutError: If the timer fired before coro finished
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(coro)
+    expired = False
+
+    def expire():
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    handle = loop.call_later(seconds, expire)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if expired:
+            raise asyncio.TimeoutError from None
+        raise
+    finally:
+        handle.cancel()
+
+
+class ExitKeyWatcher:
+    """Watches for the End key in a worker thread and sets an asyncio.Event when pressed."""
+
+    def __init__(self, poll_interval: float = 0.05):
+        self.poll_interval = poll_interval
+        self.exit_event: Optional[asyncio.Event] = None
+        self._stop = threading.Event()
+        self._future: Optional[asyncio.Future] = None
+
+    def start(self) -> asyncio.Event:
+        """Start watching; the returned Event is set once End is pressed."""
+        loop = asyncio.get_running_loop()
+        self.exit_event = asyncio.Event()
+        self._stop.clear()
+
+        def watch():
+            # Key polling lives here, off the event loop; the hot loops only
+            # read exit_event.is_set()
+            while not self._stop.is_set():
+                if check_for_exit_key():
+                    loop.call_soon_threadsafe(self.exit_event.set)
+                    return
+                time.sleep(self.poll_interval)
+
+        done = loop.create_future()
+
+        def finish():
+            if not done.done():
+                done.set_result(None)
+
+        def run():
+            try:
+                watch()
+            finally:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(finish)
+
+        # A daemon thread rather than the default executor: if stop() is never
+        # reached, a watcher still polling must not keep the process alive
+        threading.Thread(target=run, name="exit-key-watcher", daemon=True).start()
+        self._future = done
+        return self.exit_event
+
+    async def stop(self):
+        """Stop the worker thread and discard keys typed while it was watching."""
+        self._stop.set()
+        if self._future is not None:
+            await self._future
+            self._future = None
+        # GetAsyncKeyState leaves the console queue alone, so drop whatever was
+        # typed during the session before the menu's next input() sees it
+        while msvcrt.kbhit():
+            msvcrt.getch()
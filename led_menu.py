@@ -4,105 +4,321 @@ Simple command-line interface for controlling Magic Lantern LED devices.
 """
 
 import asyncio
-import sys
+import json
+import threading
+from functools import partial
+from pathlib import Path
+from string import hexdigits
+from typing import Any, Callable, Dict, Optional
 from bt_led_control.device import LT22Lamp
 from bt_led_control.dual_lamp import DualLampManager
+from bt_led_control.monitor import invalidate_monitor_cache
+from bt_led_control.ui_utils import choose_monitor_interactive
+
+# Preset colors used by the menus
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+WHITE = (255, 255, 255)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 165, 0)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+
+# Choices that work before a lamp is connected (exit, connect)
+_CONN_ALLOWED = frozenset(("0", "1"))
+
+# Monitor choice and transition speed, kept between sessions
+SETTINGS_PATH = Path.home() / ".bt_led_control.json"
+
+
+def load_settings() -> Dict[str, Any]:
+    """Read the saved menu settings; a missing or unreadable file means none."""
+    try:
+        with open(SETTINGS_PATH, encoding="utf-8") as f:
+            settings = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+def save_settings(settings: Dict[str, Any]):
+    """Write the menu settings, ignoring failures (e.g. a read-only home)."""
+    try:
+        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+            json.dump(settings, f)
+    except OSError as e:
+        print(f"⚠️ Could not save settings: {e}")
+
+
+# Printed before each ambient session; built once so a restart is one write
+_AMBIENT_PRELUDE = "\n".join(
+    [
+        "✨ Starting Ambient Screen Lighting...",
+        "This will make your LED match your screen colors!",
+        "Tip: Play a colorful video or game to see the effect",
+        "📋 Press 'END' key to exit ambient mode",
+    ]
+)
+_ULTRA_PRELUDE = "\n".join(
+    [
+        "🚀 Starting ULTRA-SMOOTH Ambient Lighting...",
+        "Maximum FPS for the smoothest experience!",
+        "Warning: This will use more CPU and BLE bandwidth",
+        "📋 Press 'END' key to exit ambient mode",
+    ]
+)
+
+
+async def run_in_daemon_thread(func, *args):
+    """
+    Run a blocking call on a daemon thread, so the event loop keeps running meanwhile.
+
+    A daemon thread rather than the default executor: a call still waiting
+    on input() must not keep the interpreter alive after Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def call():
+        try:
+            result = func(*args)
+        except BaseException as e:  # EOFError / KeyboardInterrupt reach the caller
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, result)
+
+    threading.Thread(target=call, name="menu-input", daemon=True).start()
+    return await future
+
+
+async def async_input(prompt: str = "") -> str:
+    """input() without blocking the event loop while the user types."""
+    return await run_in_daemon_thread(input, prompt)
 
 
 class LEDMenu:
     def __init__(self):
-        self.lamp = LT22Lamp()
-        self.dual_lamps = DualLampManager()
+        # Lamps and action tables are created on first use, so a session that
+        # stays in one mode never builds the other mode's lamp objects
+        self._lamp: Optional[LT22Lamp] = None
+        self._dual_lamps: Optional[DualLampManager] = None
+        self._single_actions: Optional[Dict[str, Callable]] = None
+        self._dual_actions: Optional[Dict[str, Callable]] = None
         self.connected = False
         self.dual_connected = False
-        self.selected_monitor = None  # Track selected monitor for ambient lighting
+        self._settings = load_settings()
+        # Track selected monitor for ambient lighting (restored from last session)
+        monitor_id = self._settings.get("selected_monitor")
+        self.selected_monitor = monitor_id if isinstance(monitor_id, int) else None
         self.mode = "single"  # "single" or "dual"
 
+    @property
+    def lamp(self) -> LT22Lamp:
+        """Single lamp, created on first access."""
+        if self._lamp is None:
+            self._lamp = LT22Lamp()
+        return self._lamp
+
+    @property
+    def dual_lamps(self) -> DualLampManager:
+        """Dual-lamp manager, created on first access."""
+        if self._dual_lamps is None:
+            self._dual_lamps = DualLampManager()
+            speed = self._settings.get("transition_speed")
+            if isinstance(speed, (int, float)) and 0.01 <= speed <= 1.0:
+                # Restored quietly; set_transition_speed would announce it
+                self._dual_lamps.color_transitioner.transition_speed = speed
+        return self._dual_lamps
+
+    def _save_setting(self, key: str, value: Any):
+        """Remember one setting for future sessions."""
+        self._settings[key] = value
+        save_settings(self._settings)
+
+    def _build_single_actions(self) -> Dict[str, Callable]:
+        """Menu choice -> coroutine function for single-lamp mode."""
+        announce = self._announce
+        lamp = self.lamp
+        return {
+            "0": self._exit_single,
+            "1": self._single_connect_or_red,
+            "2": partial(announce, "🟢 Setting LED to Green...", lamp.turn_green),
+            "3": partial(announce, "🔵 Setting LED to Blue...", lamp.turn_blue),
+            "4": partial(announce, "⚪ Setting LED to White...", lamp.turn_white),
+            "5": partial(announce, "⚫ Turning LED Off...", lamp.turn_off),
+            "6": self._single_custom_rgb,
+            "7": partial(
+                announce, "🟣 Setting LED to Purple...", lamp.set_color, *PURPLE
+            ),
+            "8": partial(
+                announce, "🟠 Setting LED to Orange...", lamp.set_color, *ORANGE
+            ),
+            "9": partial(
+                announce, "🟡 Setting LED to Yellow...", lamp.set_color, *YELLOW
+            ),
+            "10": partial(announce, "🩵 Setting LED to Cyan...", lamp.set_color, *CYAN),
+            "11": self._single_ambient,
+            "12": self._single_ultra_smooth,
+            "13": self._single_select_monitor,
+            "14": self.disconnect_led,
+        }
+
+    def _build_dual_actions(self) -> Dict[str, Callable]:
+        """Menu choice -> coroutine function for dual-lamp mode."""
+        announce = self._announce
+        dual = self.dual_lamps
+        return {
+            "0": self._exit_dual,
+            "1": self._dual_connect_or_red,
+            "2": partial(
+                announce,
+                "🟢 Setting both lamps to Green...",
+                dual.set_both_color,
+                *GREEN,
+            ),
+            "3": partial(
+                announce, "🔵 Setting both lamps to Blue...", dual.set_both_color, *BLUE
+            ),
+            "4": partial(
+                announce,
+                "⚪ Setting both lamps to White...",
+                dual.set_both_color,
+                *WHITE,
+            ),
+            "5": partial(announce, "🔌 Turning off both lamps...", dual.turn_off_both),
+            "6": partial(self._set_dual_pair, "🔴🔵 Left Red, Right Blue...", RED, BLUE),
+            "7": partial(
+                self._set_dual_pair, "🟢🟣 Left Green, Right Purple...", GREEN, PURPLE
+            ),
+            "8": partial(
+                self._set_dual_pair, "🟡🔷 Left Yellow, Right Cyan...", YELLOW, CYAN
+            ),
+            "9": self._dual_custom_colors,
+            "10": partial(
+                self._dual_ambilight,
+                "🌈 Starting Professional Dual-Lamp Ambilight (60 FPS)!",
+                60,
+                25,
+                2.2,
+            ),
+            "11": partial(
+                self._dual_ambilight,
+                "🚀 Starting ULTRA-SMOOTH Dual-Lamp Ambilight (120 FPS)!",
+                120,
+                30,
+                2.5,
+            ),
+            "12": self._dual_select_monitor,
+            "13": self._dual_test,
+            "14": self._dual_adjust_smoothness,
+            "15": self._dual_reconnect,
+            "16": self._dual_diagnose,
+            "17": self.disconnect_dual_lamps,
+        }
+
+    # Menu text is static per state, so each banner is built once and written
+    # with a single print instead of a print() per line
+    _MENU_HEADER = "\n".join(
+        ["", "=" * 60, "🎨 Magic Lantern LED Control Menu", "=" * 60]
+    )
+    _SINGLE_DISCONNECTED = "\n".join(
+        ["❌ Not connected to LED device", "1. Connect to LED", "0. Exit"]
+    )
+    _SINGLE_CONNECTED = "\n".join(
+        [
+            "✅ Connected to LED device",
+            "\n🎯 Basic Colors:",
+            "1. Red",
+            "2. Green",
+            "3. Blue",
+            "4. White",
+            "5. Turn Off",
+            "\n🌈 Custom Colors:",
+            "6. Set Custom RGB",
+            "7. Purple",
+            "8. Orange",
+            "9. Yellow",
+            "10. Cyan",
+            "\n✨ Special Effects:",
+            "11. Ambient Screen Lighting",
+            "12. Ultra-Smooth Ambient Lighting",
+            "13. Select Monitor for Ambient Lighting",
+            "\n⚙️ Connection:",
+            "14. Disconnect",
+            "0. Exit",
+        ]
+    )
+    _DUAL_DISCONNECTED = "\n".join(
+        [
+            "❌ Not connected to dual-lamp setup",
+            "1. Connect to Dual-Lamp Setup",
+            "0. Exit",
+            "-" * 60,
+        ]
+    )
+    _DUAL_CONNECTED = "\n".join(
+        [
+            "🔥 Connected to DUAL-LAMP setup",
+            "   Left Lamp (37:C8) + Right Lamp (39:FD)",
+            "\n🎯 Basic Colors:",
+            "1. Both Red",
+            "2. Both Green",
+            "3. Both Blue",
+            "4. Both White",
+            "5. Turn Off Both",
+            "\n🌈 Dual Colors:",
+            "6. Left Red, Right Blue",
+            "7. Left Green, Right Purple",
+            "8. Left Yellow, Right Cyan",
+            "9. Custom Dual Colors",
+            "\n🔥 PROFESSIONAL AMBILIGHT:",
+            "10. 🌈 Dual-Lamp Ambilight (60 FPS)",
+            "11. 🚀 Ultra-Smooth Dual Ambilight (120 FPS)",
+            "12. Select Monitor for Ambilight",
+            "13. Test Both Lamps",
+            "\n⚙️ Settings & Connection:",
+            "14. 🌊 Adjust Color Transition Smoothness",
+            "15. Reconnect Lamps",
+            "16. 🔧 Diagnose Lamp Issues",
+            "17. Disconnect Dual Setup",
+            "0. Exit",
+            "-" * 60,
+        ]
+    )
+    # Whole screens (header, mode line and body) per (mode, connected), so a
+    # redraw is one lookup and one print
+    _SINGLE_HEADER = "\n".join(
+        [
+            _MENU_HEADER,
+            "Current Mode: 💡 Single Lamp",
+            "M. Switch Mode (Single ↔ Dual-Lamp)",
+        ]
+    )
+    _DUAL_HEADER = "\n".join(
+        [
+            _MENU_HEADER,
+            "Current Mode: 🔥 DUAL-LAMP AMBILIGHT",
+            "M. Switch Mode (Single ↔ Dual-Lamp)",
+        ]
+    )
+    _MENU_SCREENS = {
+        ("single", False): f"{_SINGLE_HEADER}\n{_SINGLE_DISCONNECTED}",
+        ("single", True): f"{_SINGLE_HEADER}\n{_SINGLE_CONNECTED}",
+        ("dual", False): f"{_DUAL_HEADER}\n{_DUAL_DISCONNECTED}",
+        ("dual", True): f"{_DUAL_HEADER}\n{_DUAL_CONNECTED}",
+    }
+
     def show_menu(self):
         """Display the main menu options."""
-        print("\n" + "=" * 60)
-        print("🎨 Magic Lantern LED Control Menu")
-        print("=" * 60)
-
-        # Mode selection
-        print(
-            f"Current Mode: {'🔥 DUAL-LAMP AMBILIGHT' if self.mode == 'dual' else '💡 Single Lamp'}"
-        )
-        print("M. Switch Mode (Single ↔ Dual-Lamp)")
-
         if self.mode == "single":
-            self._show_single_lamp_menu()
+            print(self._MENU_SCREENS["single", self.connected])
         else:
-            self._show_dual_lamp_menu()
-
-    def _show_single_lamp_menu(self):
-        """Show single lamp menu options."""
-        if not self.connected:
-            print("❌ Not connected to LED device")
-            print("1. Connect to LED")
-            print("0. Exit")
-        else:
-            print("✅ Connected to LED device")
-            print("\n🎯 Basic Colors:")
-            print("1. Red")
-            print("2. Green")
-            print("3. Blue")
-            print("4. White")
-            print("5. Turn Off")
-
-            print("\n🌈 Custom Colors:")
-            print("6. Set Custom RGB")
-            print("7. Purple")
-            print("8. Orange")
-            print("9. Yellow")
-            print("10. Cyan")
-
-            print("\n✨ Special Effects:")
-            print("11. Ambient Screen Lighting")
-            print("12. Ultra-Smooth Ambient Lighting")
-            print("13. Select Monitor for Ambient Lighting")
-
-            print("\n⚙️ Connection:")
-            print("14. Disconnect")
-            print("0. Exit")
-
-    def _show_dual_lamp_menu(self):
-        """Show dual lamp menu options."""
-        if not self.dual_connected:
-            print("❌ Not connected to dual-lamp setup")
-            print("1. Connect to Dual-Lamp Setup")
-            print("0. Exit")
-        else:
-            print("🔥 Connected to DUAL-LAMP setup")
-            print("   Left Lamp (37:C8) + Right Lamp (39:FD)")
-
-            print("\n🎯 Basic Colors:")
-            print("1. Both Red")
-            print("2. Both Green")
-            print("3. Both Blue")
-            print("4. Both White")
-            print("5. Turn Off Both")
-
-            print("\n🌈 Dual Colors:")
-            print("6. Left Red, Right Blue")
-            print("7. Left Green, Right Purple")
-            print("8. Left Yellow, Right Cyan")
-            print("9. Custom Dual Colors")
-
-            print("\n🔥 PROFESSIONAL AMBILIGHT:")
-            print("10. 🌈 Dual-Lamp Ambilight (60 FPS)")
-            print("11. 🚀 Ultra-Smooth Dual Ambilight (120 FPS)")
-            print("12. Select Monitor for Ambilight")
-            print("13. Test Both Lamps")
-
-            print("\n⚙️ Settings & Connection:")
-            print("14. 🌊 Adjust Color Transition Smoothness")
-            print("15. Reconnect Lamps")
-            print("16. 🔧 Diagnose Lamp Issues")
-            print("17. Disconnect Dual Setup")
-            print("0. Exit")
-
-        print("-" * 60)
+            print(self._MENU_SCREENS["dual", self.dual_connected])
 
     async def connect_led(self):
         """Connect to the LED device."""
@@ -117,7 +333,7 @@ class LEDMenu:
         """Connect to both lamps in dual setup."""
         print("🔍 Connecting to dual-lamp setup...")
         connections = await self.dual_lamps.connect_both()
-        self.dual_connected = any(connections.values())
+        self.dual_connected = connections["left"] or connections["right"]
 
     async def disconnect_led(self):
         """Disconnect from the LED device."""
@@ -132,8 +348,14 @@ class LEDMenu:
         await self.dual_lamps.disconnect_both()
         self.dual_connected = False
 
-    async def diagnose_lamp_issues(self):
-        """Diagnose connection and communication issues with lamps."""
+    async def diagnose_lamp_issues(self, deep: bool = False):
+        """
+        Diagnose connection and communication issues with lamps.
+
+        Args:
+            deep: Always run the color response test, even when both BLE
+                links report healthy
+        """
         if not self.dual_lamps:
             print("❌ Dual lamp system not initialized")
             return
@@ -156,67 +378,40 @@ class LEDMenu:
             print("⚠️ Both lamps disconnected. Try reconnecting first.")
             return
 
-        # Test individual lamp responses
-        print("\n🧪 Testing Individual Lamp Responses:")
-
-        test_colors = [
-            ("Red", 255, 0, 0),
-            ("Green", 0, 255, 0),
-            ("Blue", 0, 0, 255),
-        ]
-
-        for color_name, r, g, b in test_colors:
-            print(f"\n   Testing {color_name}...")
-
-            if left_connected:
-                try:
-                    left_result = await self.dual_lamps.set_left_color(r, g, b)
-                    print(
-                        f"   Left Lamp {color_name}: {'✅ Success' if left_result else '❌ Failed'}"
-                    )
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    print(f"   Left Lamp {color_name}: ❌ Exception: {e}")
-
-            if right_connected:
-                try:
-                    right_result = await self.dual_lamps.set_right_color(r, g, b)
-                    print(
-                        f"   Right Lamp {color_name}: {'✅ Success' if right_result else '❌ Failed'}"
-                    )
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    print(f"   Right Lamp {color_name}: ❌ Exception: {e}")
-
         # Check BLE connection health
         print("\n🔍 BLE Connection Health:")
-        try:
-            if left_connected and hasattr(
-                self.dual_lamps.left_lamp.ble, "is_connected"
-            ):
-                ble_left = self.dual_lamps.left_lamp.ble.is_connected()
+        # BLEManager always has is_connected(), so no capability probe is needed
+        healthy = []
+        for side, lamp, connected in (
+            ("Left", self.dual_lamps.left_lamp, left_connected),
+            ("Right", self.dual_lamps.right_lamp, right_connected),
+        ):
+            if not connected:
+                continue
+            try:
+                ble_active = lamp.ble.is_connected()
                 print(
-                    f"   Left BLE Status: {'✅ Active' if ble_left else '❌ Inactive'}"
+                    f"   {side} BLE Status: {'✅ Active' if ble_active else '❌ Inactive'}"
                 )
-                if not ble_left:
-                    print("   ⚠️ Left lamp marked connected but BLE shows inactive!")
+                healthy.append(ble_active)
+                if not ble_active:
+                    print(
+                        f"   ⚠️ {side} lamp marked connected but BLE shows inactive!"
+                    )
+            except Exception as e:
+                healthy.append(False)
+                print(f"   {side} BLE Check: ❌ Error: {e}")
 
-        except Exception as e:
-            print(f"   Left BLE Check: ❌ Error: {e}")
+        # With both links up, the color sweep (seconds of writes) only runs on
+        # request, e.g. to find a lamp that stopped reacting to writes
+        run_sweep = deep or not (len(healthy) == 2 and all(healthy))
+        if not run_sweep:
+            print("\n✅ Both lamps look healthy")
+            answer = await async_input("Run the color response test anyway? (y/N): ")
+            run_sweep = answer.strip().lower() == "y"
 
-        try:
-            if right_connected and hasattr(
-                self.dual_lamps.right_lamp.ble, "is_connected"
-            ):
-                ble_right = self.dual_lamps.right_lamp.ble.is_connected()
-                print(
-                    f"   Right BLE Status: {'✅ Active' if ble_right else '❌ Inactive'}"
-                )
-                if not ble_right:
-                    print("   ⚠️ Right lamp marked connected but BLE shows inactive!")
-
-        except Exception as e:
-            print(f"   Right BLE Check: ❌ Error: {e}")
+        if run_sweep:
+            await self._diagnose_color_sweep(left_connected, right_connected)
 
         # Recommendations
         print("\n💡 Recommendations:")
@@ -235,7 +430,47 @@ class LEDMenu:
 
         print("-" * 50)
 
-    def adjust_transition_smoothness(self):
+    async def _diagnose_color_sweep(
+        self, left_connected: bool, right_connected: bool
+    ):
+        """Write test colors to the connected lamps and report each result."""
+        print("\n🧪 Testing Individual Lamp Responses:")
+
+        test_colors = [
+            ("Red", 255, 0, 0),
+            ("Green", 0, 255, 0),
+            ("Blue", 0, 0, 255),
+        ]
+
+        lamp_writers = []
+        if left_connected:
+            lamp_writers.append(("Left", self.dual_lamps.set_left_color))
+        if right_connected:
+            lamp_writers.append(("Right", self.dual_lamps.set_right_color))
+
+        last_color = test_colors[-1][0]
+        for color_name, r, g, b in test_colors:
+            print(f"\n   Testing {color_name}...")
+
+            # Write both lamps at once; return_exceptions keeps one lamp's
+            # failure from cancelling the other's write
+            results = await asyncio.gather(
+                *(set_color(r, g, b) for _, set_color in lamp_writers),
+                return_exceptions=True,
+            )
+            for (side, _), result in zip(lamp_writers, results):
+                if isinstance(result, Exception):
+                    print(f"   {side} Lamp {color_name}: ❌ Exception: {result}")
+                else:
+                    print(
+                        f"   {side} Lamp {color_name}: {'✅ Success' if result else '❌ Failed'}"
+                    )
+            if color_name != last_color:
+                # Hold each color long enough to see, except the last one,
+                # which stays lit after the test anyway
+                await asyncio.sleep(0.5)
+
+    async def adjust_transition_smoothness(self):
         """Allow user to adjust color transition smoothness."""
         print("🌊 Color Transition Smoothness Settings")
         print("-" * 40)
@@ -253,19 +488,21 @@ class LEDMenu:
         print("6. 🎛️ Custom Value")
 
         try:
-            choice = input("\nChoose setting (1-6): ").strip()
+            choice = (await async_input("\nChoose setting (1-6): ")).strip()
 
             speed_map = {"1": 0.10, "2": 0.15, "3": 0.25, "4": 0.40, "5": 1.00}
 
             if choice in speed_map:
                 speed = speed_map[choice]
                 self.dual_lamps.set_transition_speed(speed)
+                self._save_setting("transition_speed", speed)
                 print(f"✅ Transition speed set to {speed:.2f}")
             elif choice == "6":
                 try:
-                    speed = float(input("Enter custom speed (0.01-1.00): "))
+                    speed = float(await async_input("Enter custom speed (0.01-1.00): "))
                     if 0.01 <= speed <= 1.0:
                         self.dual_lamps.set_transition_speed(speed)
+                        self._save_setting("transition_speed", speed)
                         print(f"✅ Custom transition speed set to {speed:.2f}")
                     else:
                         print("❌ Speed must be between 0.01 and 1.00")
@@ -277,15 +514,31 @@ class LEDMenu:
         except Exception as e:
             print(f"❌ Error adjusting smoothness: {e}")
 
-    def get_custom_rgb(self):
-        """Get RGB values from user input."""
+    async def get_custom_rgb(self):
+        """Get RGB values from one line of user input ("255 128 0" or "#FF8000")."""
         try:
-            print("\nEnter RGB values (0-255):")
-            red = int(input("Red: "))
-            green = int(input("Green: "))
-            blue = int(input("Blue: "))
+            raw = (
+                await async_input("\nEnter RGB (0-255, space-separated) or #RRGGBB: ")
+            ).strip()
+
+            if raw.startswith("#"):
+                digits = raw[1:]
+                if len(digits) != 6 or not all(c in hexdigits for c in digits):
+                    raise ValueError(raw)
+                # One int() for all three channels
+                value = int(digits, 16)
+                return value >> 16, (value >> 8) & 0xFF, value & 0xFF
+
+            parts = raw.replace(",", " ").split()
+            if len(parts) != 3:
+                print("❌ Please enter exactly three values, e.g. 255 128 0")
+                return None
+            values = list(map(int, parts))
 
-            if not all(0 <= val <= 255 for val in [red, green, blue]):
+            try:
+                # bytes() range-checks all three channels at once, in C
+                red, green, blue = bytes(values)
+            except ValueError:
                 print("❌ RGB values must be between 0 and 255")
                 return None
 
@@ -294,15 +547,15 @@ class LEDMenu:
             print("❌ Invalid input. Please enter numbers only.")
             return None
 
-    def get_dual_custom_colors(self):
+    async def get_dual_custom_colors(self):
         """Get RGB values for both lamps."""
         print("\n🔵 Left Lamp Color:")
-        left_color = self.get_custom_rgb()
+        left_color = await self.get_custom_rgb()
         if not left_color:
             return None, None
 
         print("\n🔴 Right Lamp Color:")
-        right_color = self.get_custom_rgb()
+        right_color = await self.get_custom_rgb()
         if not right_color:
             return None, None
 
@@ -325,130 +578,22 @@ class LEDMenu:
 
     async def _handle_single_choice(self, choice):
         """Handle single lamp menu choices."""
-        if not self.connected and choice != "1" and choice != "0":
+        if not self.connected and choice not in _CONN_ALLOWED:
             print("❌ Please connect to LED first!")
             return True
 
-        try:
-            if choice == "0":
-                if self.connected:
-                    await self.disconnect_led()
-                print("👋 Goodbye!")
-                return False
-
-            elif choice == "1":
-                if not self.connected:
-                    await self.connect_led()
-                else:
-                    print("🔴 Setting LED to Red...")
-                    await self.lamp.turn_red()
-                    print("✅ Done!")
-
-            # Continue with existing single lamp choices...
-            elif choice == "2":
-                print("🟢 Setting LED to Green...")
-                await self.lamp.turn_green()
-                print("✅ Done!")
-
-            elif choice == "3":
-                print("🔵 Setting LED to Blue...")
-                await self.lamp.turn_blue()
-                print("✅ Done!")
-
-            elif choice == "4":
-                print("⚪ Setting LED to White...")
-                await self.lamp.turn_white()
-                print("✅ Done!")
-
-            elif choice == "5":
-                print("⚫ Turning LED Off...")
-                await self.lamp.turn_off()
-                print("✅ Done!")
-
-            elif choice == "6":
-                rgb = self.get_custom_rgb()
-                if rgb:
-                    red, green, blue = rgb
-                    print(f"🎨 Setting LED to RGB({red}, {green}, {blue})...")
-                    await self.lamp.set_color(red, green, blue)
-                    print("✅ Done!")
-
-            elif choice == "7":
-                print("🟣 Setting LED to Purple...")
-                await self.lamp.set_color(128, 0, 128)
-                print("✅ Done!")
-
-            elif choice == "8":
-                print("🟠 Setting LED to Orange...")
-                await self.lamp.set_color(255, 165, 0)
-                print("✅ Done!")
-
-            elif choice == "9":
-                print("🟡 Setting LED to Yellow...")
-                await self.lamp.set_color(255, 255, 0)
-                print("✅ Done!")
-
-            elif choice == "10":
-                print("🩵 Setting LED to Cyan...")
-                await self.lamp.set_color(0, 255, 255)
-                print("✅ Done!")
-
-            elif choice == "11":
-                print("✨ Starting Ambient Screen Lighting...")
-                print("This will make your LED match your screen colors!")
-                print("Tip: Play a colorful video or game to see the effect")
-                print("📋 Press 'END' key to exit ambient mode")
-
-                # Use selected monitor if available
-                if (
-                    hasattr(self, "selected_monitor")
-                    and self.selected_monitor is not None
-                ):
-                    print(f"🖥️  Using selected monitor {self.selected_monitor}")
-                    await self.lamp.start_ambient_lighting(
-                        monitor_id=self.selected_monitor
-                    )
-                else:
-                    await self.lamp.start_ambient_lighting()
-
-            elif choice == "12":
-                print("🚀 Starting ULTRA-SMOOTH Ambient Lighting...")
-                print("Maximum FPS for the smoothest experience!")
-                print("Warning: This will use more CPU and BLE bandwidth")
-                print("📋 Press 'END' key to exit ambient mode")
-
-                # Use selected monitor if available
-                if (
-                    hasattr(self, "selected_monitor")
-                    and self.selected_monitor is not None
-                ):
-                    print(f"🖥️  Using selected monitor {self.selected_monitor}")
-                    await self.lamp.start_ultra_smooth_ambient(
-                        monitor_id=self.selected_monitor
-                    )
-                else:
-                    await self.lamp.start_ultra_smooth_ambient()
-
-            elif choice == "13":
-                print("🖥️  Monitor Selection for Ambient Lighting")
-                from bt_led_control.ui_utils import choose_monitor_interactive
-
-                monitor_id = choose_monitor_interactive()
-                if monitor_id is not None:
-                    print(
-                        f"✅ Monitor {monitor_id} will be used for future ambient lighting"
-                    )
-                    # Store the selected monitor for future use
-                    self.selected_monitor = monitor_id
-                else:
-                    print("❌ Monitor selection cancelled")
-
-            elif choice == "14":
-                await self.disconnect_led()
-
-            else:
-                print("❌ Invalid choice. Please try again.")
+        actions = self._single_actions
+        if actions is None:
+            # Built once, on the first choice made in this mode
+            actions = self._single_actions = self._build_single_actions()
+        action = actions.get(choice)
+        if action is None:
+            print("❌ Invalid choice. Please try again.")
+            return True
 
+        try:
+            # Actions return False only to leave the menu
+            return await action() is not False
         except Exception as e:
             print(f"❌ Error: {e}")
 
@@ -456,139 +601,167 @@ class LEDMenu:
 
     async def _handle_dual_choice(self, choice):
         """Handle dual lamp menu choices."""
-        if not self.dual_connected and choice != "1" and choice != "0":
+        if not self.dual_connected and choice not in _CONN_ALLOWED:
             print("❌ Please connect to dual-lamp setup first!")
             return True
 
+        actions = self._dual_actions
+        if actions is None:
+            # Built once, on the first choice made in this mode
+            actions = self._dual_actions = self._build_dual_actions()
+        action = actions.get(choice)
+        if action is None:
+            print("❌ Invalid choice. Please try again.")
+            return True
+
         try:
-            if choice == "0":
-                if self.dual_connected:
-                    await self.disconnect_dual_lamps()
-                print("👋 Goodbye!")
-                return False
-
-            elif choice == "1":
-                if not self.dual_connected:
-                    await self.connect_dual_lamps()
-                else:
-                    print("🔴 Setting both lamps to Red...")
-                    await self.dual_lamps.set_both_color(255, 0, 0)
-                    print("✅ Done!")
-
-            elif choice == "2":
-                print("🟢 Setting both lamps to Green...")
-                await self.dual_lamps.set_both_color(0, 255, 0)
-                print("✅ Done!")
-
-            elif choice == "3":
-                print("🔵 Setting both lamps to Blue...")
-                await self.dual_lamps.set_both_color(0, 0, 255)
-                print("✅ Done!")
-
-            elif choice == "4":
-                print("⚪ Setting both lamps to White...")
-                await self.dual_lamps.set_both_color(255, 255, 255)
-                print("✅ Done!")
-
-            elif choice == "5":
-                print("🔌 Turning off both lamps...")
-                await self.dual_lamps.turn_off_both()
-                print("✅ Done!")
+            # Actions return False only to leave the menu
+            return await action() is not False
+        except Exception as e:
+            print(f"❌ Error: {e}")
 
-            elif choice == "6":
-                print("🔴🔵 Left Red, Right Blue...")
-                await self.dual_lamps.set_left_color(255, 0, 0)
-                await self.dual_lamps.set_right_color(0, 0, 255)
-                print("✅ Done!")
-
-            elif choice == "7":
-                print("🟢🟣 Left Green, Right Purple...")
-                await self.dual_lamps.set_left_color(0, 255, 0)
-                await self.dual_lamps.set_right_color(128, 0, 128)
-                print("✅ Done!")
-
-            elif choice == "8":
-                print("🟡🔷 Left Yellow, Right Cyan...")
-                await self.dual_lamps.set_left_color(255, 255, 0)
-                await self.dual_lamps.set_right_color(0, 255, 255)
-                print("✅ Done!")
-
-            elif choice == "9":
-                left_color, right_color = self.get_dual_custom_colors()
-                if left_color and right_color:
-                    print(f"🎨 Setting Left: RGB{left_color}, Right: RGB{right_color}")
-                    await self.dual_lamps.set_left_color(*left_color)
-                    await self.dual_lamps.set_right_color(*right_color)
-                    print("✅ Done!")
-
-            elif choice == "10":
-                print("🌈 Starting Professional Dual-Lamp Ambilight (60 FPS)!")
-                monitor_id = (
-                    self.selected_monitor if self.selected_monitor is not None else 0
-                )
-                await self.dual_lamps.start_dual_ambilight(
-                    fps=60,
-                    brightness_boost=25,
-                    saturation_factor=2.2,
-                    monitor_id=monitor_id,
-                )
+        return True
 
-            elif choice == "11":
-                print("🚀 Starting ULTRA-SMOOTH Dual-Lamp Ambilight (120 FPS)!")
-                monitor_id = (
-                    self.selected_monitor if self.selected_monitor is not None else 0
-                )
-                await self.dual_lamps.start_dual_ambilight(
-                    fps=120,
-                    brightness_boost=30,
-                    saturation_factor=2.5,
-                    monitor_id=monitor_id,
-                )
+    # Menu actions, dispatched through _single_actions / _dual_actions
 
-            elif choice == "12":
-                print("🖥️  Monitor Selection for Dual Ambilight")
-                from bt_led_control.ui_utils import choose_monitor_interactive
+    async def _announce(self, message, action, *args):
+        """Print message, run a lamp action and confirm."""
+        print(message)
+        await action(*args)
+        print("✅ Done!")
 
-                monitor_id = choose_monitor_interactive()
-                if monitor_id is not None:
-                    print(f"✅ Monitor {monitor_id} will be used for dual ambilight")
-                    self.selected_monitor = monitor_id
-                else:
-                    print("❌ Monitor selection cancelled")
-
-            elif choice == "13":
-                print("🧪 Testing both lamps...")
-                await self.dual_lamps.test_lamps()
-
-            elif choice == "14":
-                print("🌊 Adjusting color transition smoothness...")
-                self.adjust_transition_smoothness()
-
-            elif choice == "15":
-                print("🔄 Reconnecting both lamps...")
-                if self.dual_lamps:
-                    success = await self.dual_lamps.reconnect_both()
-                    if success:
-                        print("✅ Both lamps reconnected successfully!")
-                    else:
-                        print("❌ Failed to reconnect one or both lamps")
-                else:
-                    print("❌ Dual lamp system not initialized")
+    async def _set_dual_pair(self, message, left, right):
+        """Set the left and right lamps to two preset colors."""
+        print(message)
+        await self.dual_lamps.apply_batch([("left", left), ("right", right)])
+        print("✅ Done!")
 
-            elif choice == "16":
-                print("🔧 Diagnosing lamp connection issues...")
-                await self.diagnose_lamp_issues()
+    async def _exit_single(self):
+        if self.connected:
+            await self.disconnect_led()
+        print("👋 Goodbye!")
+        return False
 
-            elif choice == "17":
-                await self.disconnect_dual_lamps()
+    async def _single_connect_or_red(self):
+        if not self.connected:
+            await self.connect_led()
+        else:
+            await self._announce("🔴 Setting LED to Red...", self.lamp.turn_red)
+
+    async def _single_custom_rgb(self):
+        rgb = await self.get_custom_rgb()
+        if rgb:
+            red, green, blue = rgb
+            print(f"🎨 Setting LED to RGB({red}, {green}, {blue})...")
+            await self.lamp.set_color(red, green, blue)
+            print("✅ Done!")
+
+    async def _single_ambient(self):
+        print(_AMBIENT_PRELUDE)
+
+        # Use selected monitor if available
+        if self.selected_monitor is not None:
+            print(f"🖥️  Using selected monitor {self.selected_monitor}")
+            await self.lamp.start_ambient_lighting(monitor_id=self.selected_monitor)
+        else:
+            await self.lamp.start_ambient_lighting()
+        # Displays may have changed during the session; rescan on next selection
+        invalidate_monitor_cache()
+
+    async def _single_ultra_smooth(self):
+        print(_ULTRA_PRELUDE)
+
+        # Use selected monitor if available
+        if self.selected_monitor is not None:
+            print(f"🖥️  Using selected monitor {self.selected_monitor}")
+            await self.lamp.start_ultra_smooth_ambient(
+                monitor_id=self.selected_monitor
+            )
+        else:
+            await self.lamp.start_ultra_smooth_ambient()
+        # Displays may have changed during the session; rescan on next selection
+        invalidate_monitor_cache()
+
+    async def _single_select_monitor(self):
+        print("🖥️  Monitor Selection for Ambient Lighting")
+        # The picker reads input() itself; keep the event loop running meanwhile
+        monitor_id = await run_in_daemon_thread(choose_monitor_interactive)
+        if monitor_id is not None:
+            print(f"✅ Monitor {monitor_id} will be used for future ambient lighting")
+            # Store the selected monitor for future use
+            self.selected_monitor = monitor_id
+            self._save_setting("selected_monitor", monitor_id)
+        else:
+            print("❌ Monitor selection cancelled")
 
-            else:
-                print("❌ Invalid choice. Please try again.")
+    async def _exit_dual(self):
+        if self.dual_connected:
+            await self.disconnect_dual_lamps()
+        print("👋 Goodbye!")
+        return False
 
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    async def _dual_connect_or_red(self):
+        if not self.dual_connected:
+            await self.connect_dual_lamps()
+        else:
+            await self._announce(
+                "🔴 Setting both lamps to Red...", self.dual_lamps.set_both_color, *RED
+            )
 
-        return True
+    async def _dual_custom_colors(self):
+        left_color, right_color = await self.get_dual_custom_colors()
+        if left_color and right_color:
+            await self._set_dual_pair(
+                f"🎨 Setting Left: RGB{left_color}, Right: RGB{right_color}",
+                left_color,
+                right_color,
+            )
+
+    async def _dual_ambilight(self, message, fps, brightness_boost, saturation_factor):
+        print(message)
+        monitor_id = self.selected_monitor if self.selected_monitor is not None else 0
+        await self.dual_lamps.start_dual_ambilight(
+            fps=fps,
+            brightness_boost=brightness_boost,
+            saturation_factor=saturation_factor,
+            monitor_id=monitor_id,
+        )
+        # Displays may have changed during the session; rescan on next selection
+        invalidate_monitor_cache()
+
+    async def _dual_select_monitor(self):
+        print("🖥️  Monitor Selection for Dual Ambilight")
+        # The picker reads input() itself; keep the event loop running meanwhile
+        monitor_id = await run_in_daemon_thread(choose_monitor_interactive)
+        if monitor_id is not None:
+            print(f"✅ Monitor {monitor_id} will be used for dual ambilight")
+            self.selected_monitor = monitor_id
+            self._save_setting("selected_monitor", monitor_id)
+        else:
+            print("❌ Monitor selection cancelled")
+
+    async def _dual_test(self):
+        print("🧪 Testing both lamps...")
+        await self.dual_lamps.test_lamps()
+
+    async def _dual_adjust_smoothness(self):
+        print("🌊 Adjusting color transition smoothness...")
+        await self.adjust_transition_smoothness()
+
+    async def _dual_reconnect(self):
+        print("🔄 Reconnecting both lamps...")
+        if self.dual_lamps:
+            success = await self.dual_lamps.reconnect_both()
+            if success:
+                print("✅ Both lamps reconnected successfully!")
+            else:
+                print("❌ Failed to reconnect one or both lamps")
+        else:
+            print("❌ Dual lamp system not initialized")
+
+    async def _dual_diagnose(self):
+        print("🔧 Diagnosing lamp connection issues...")
+        await self.diagnose_lamp_issues()
 
     async def run(self):
         """Run the interactive menu."""
@@ -597,23 +770,27 @@ class LEDMenu:
         try:
             while True:
                 self.show_menu()
-                choice = input("\nEnter your choice: ").strip()
+                choice = (await async_input("\nEnter your choice: ")).strip()
 
                 if not await self.handle_choice(choice):
                     break
 
-                # Small delay to see the result
-                await asyncio.sleep(0.5)
-
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C while awaiting input cancels this task instead of
+            # raising KeyboardInterrupt here (asyncio.run's SIGINT handling)
             print("\n\n⚡ Interrupted by user")
-            if self.connected:
-                await self.disconnect_led()
+            await self._disconnect_all()
 
         except Exception as e:
             print(f"\n❌ Unexpected error: {e}")
-            if self.connected:
-                await self.disconnect_led()
+            await self._disconnect_all()
+
+    async def _disconnect_all(self):
+        """Disconnect whichever lamps (single and/or dual) are connected."""
+        if self.connected:
+            await self.disconnect_led()
+        if self.dual_connected:
+            await self.disconnect_dual_lamps()
 
 
 async def main():
@@ -623,4 +800,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass  # Already reported and cleaned up by LEDMenu.run